@@ -21,6 +21,7 @@ Features:
 
 Configuration:
 - Uses config.yaml for settings, with fallback to default values
+- Log cleanup and config loading happen when the first Logger is created, not at import
 - Allows forcing a global log level for the entire program
 
 Usage Example:
@@ -31,6 +32,7 @@ Usage Example:
     logger.error("An error occurred")
 
 Advanced Usage:
+    logger.debug("x=%s y=%s", x, y)  # Preferred: the message is only built if DEBUG is enabled
     logger.info("Important message", f=True)  # Formats message with asterisks
     logger.debug("Pausing after this", t=2)   # Pauses execution for 2 seconds after logging
     logger.warning("Silent warning", off=True)  # Logs message but doesn't print to console
@@ -40,28 +42,53 @@ Note:
 - The 'q' parameter in logging methods is deprecated due to Python's limitations 
   in differentiating between regular and formatted strings at runtime.
 """
+import atexit
 from datetime import datetime
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import sys
+import threading
 import time
-from typing import Callable
 import uuid
+import weakref
 
 
 import yaml
 
 
+from .utils.logger.buffered_file_handler import BufferedFileHandler
 from .utils.logger.delete_logs_if_they_get_too_big_on_disk import (
     delete_logs_if_they_get_too_big_on_disk
 )
 from .utils.logger.move_logs_folders_into_this_folder_if_there_are_too_many_of_them import (
     move_logs_folders_into_this_folder_if_there_are_too_many_of_them
 )
+from .utils.logger.precompiled_formatter import PrecompiledFormatter
+from .utils.logger.scan_debug_tree import scan_debug_tree
 from .utils.logger.delete_empty_folders_in import delete_empty_folders_in
 from .utils.logger.delete_empty_files_in import delete_empty_files_in
 
+# Logger instances by (logger_name, prompt_name, batch_id). See Logger.__new__
+_LOGGER_CACHE: dict[tuple, "Logger"] = {}
+# Guards _LOGGER_CACHE and Logger construction, so two threads never build the same Logger at once.
+_LOGGER_CACHE_LOCK = threading.RLock()
+
+def _cache_key(logger_name: str, prompt_name: str, batch_id: str) -> tuple | None:
+    """
+    The _LOGGER_CACHE key for a Logger, or None if it isn't cached.
+    Prompt loggers without a batch id always get a new batch, so they aren't cached.
+    """
+    if logger_name == "prompt" and batch_id is None:
+        return None
+    return (logger_name, prompt_name, batch_id)
+
+# Longest asterisk bar _f will put around a message.
+_ASTERISKS = "*" * 100
+
 def make_id():
     return str(uuid.uuid4())
 
@@ -70,49 +97,168 @@ def make_id():
 script_dir = os.path.dirname(os.path.realpath(__file__))
 PROJECT_ROOT = os.path.dirname(script_dir)
 PROGRAM_NAME = os.path.basename(PROJECT_ROOT)
-debug_log_folder = os.path.join(PROJECT_ROOT, "debug_logs")
-overflow_debug_folder = os.path.join(debug_log_folder, "overflow_debug_logs")
-
-# Clean up debug folders.
-delete_empty_files_in(debug_log_folder, with_ending=".log")
-delete_empty_files_in(script_dir, with_ending='.Identifier')
+overflow_debug_folder = os.path.join(PROJECT_ROOT, "debug_logs", "overflow_debug_logs")
+config_path = os.path.join(PROJECT_ROOT, 'config.yaml')
 max_size_in_megabytes = 200
-delete_logs_if_they_get_too_big_on_disk(debug_log_folder, max_size_in_megabytes)
-delete_empty_folders_in(debug_log_folder)
-move_logs_folders_into_this_folder_if_there_are_too_many_of_them(overflow_debug_folder, debug_log_folder, too_many=25)
+# Each log file is rotated into this many backups, so one logger's files in a run stay under max_size_in_megabytes total.
+log_file_backup_count = 4
 
 
-# Create a folder for current instantiation of the class.
-# This should be created a-new every time the program is run or tested.
-_RIGHT_NOW = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-debug_log_folder = os.path.join(debug_log_folder, _RIGHT_NOW)
-if not os.path.exists(debug_log_folder):
-    os.mkdir(debug_log_folder)
+# Use the libyaml-backed loader when PyYAML was built with it. It's a drop-in for SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-# Create a folder for current instantiation of the class.
-# This should be created a-new every time the program is run or tested.
-_RIGHT_NOW = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-debug_log_folder = os.path.join(debug_log_folder, _RIGHT_NOW)
-if not os.path.exists(debug_log_folder):
-    os.mkdir(debug_log_folder)
+def _load_config(path: str, use_cache: bool = None) -> dict:
+    """
+    Load the yaml config file at path.
+    If use_cache is True (set LOGGER_CONFIG_CACHE=1), the parsed result is cached in a hidden JSON
+    sidecar file keyed by the config's mtime and size, so the (slow) YAML parse only happens
+    when the config actually changes. It's opt-in so read-only deployments never see surprise writes.
+    """
+    if use_cache is None:
+        use_cache = os.environ.get("LOGGER_CONFIG_CACHE") == "1"
+    if not use_cache:
+        with open(path, "r") as f:
+            return yaml.load(f, Loader=_YAML_LOADER)
+
+    st = os.stat(path)
+    header = json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size})
+    folder, filename = os.path.split(path)
+    cache_path = os.path.join(folder, f".{filename}.cache.json")
+
+    try:
+        with open(cache_path, "r") as f:
+            if f.readline().rstrip("\n") == header:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass # Missing or corrupt cache. Fall back to parsing the yaml.
+
+    with open(path, "r") as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+
+    # Write the cache atomically so concurrent processes never read a half-written file.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(header + "\n")
+            json.dump(config, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError): # Read-only folder or values JSON can't represent.
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return config
+
+
+def _clean_up_debug_folder(debug_folder: str) -> None:
+    """
+    Clean up the logs left over from previous runs.
+    Skips it entirely on the first run, or when previous runs left nothing behind.
+    """
+    if os.path.isdir(debug_folder):
+        with os.scandir(debug_folder) as entries:
+            if next(entries, None) is None:
+                return
+    else:
+        os.makedirs(debug_folder, exist_ok=True)
+        return
+
+    # Walk the debug folder once, and hand the results to each cleanup function instead of having each re-walk it.
+    log_files, empty_folders = scan_debug_tree(debug_folder)
+    delete_empty_files_in(debug_folder, with_ending=".log", files=log_files)
+    deleted_log_count = delete_logs_if_they_get_too_big_on_disk(
+        debug_folder, max_size_in_megabytes, log_files=[log_file for log_file in log_files if log_file[1] > 0]
+    )
+    # Deleting big logs can empty more folders than the scan found, so walk the folder again in that case.
+    delete_empty_folders_in(debug_folder, empty_folders=None if deleted_log_count else empty_folders)
+    move_logs_folders_into_this_folder_if_there_are_too_many_of_them(overflow_debug_folder, debug_folder, too_many=25)
+
+
+def _sweep_once() -> None:
+    """
+    Delete empty Zone.Identifier files from the logger's folder.
+    """
+    delete_empty_files_in(script_dir, with_ending='.Identifier')
 
 
-# Import DEBUG config
-# NOTE We do a separate yaml import to avoid circular imports with the config file.
-config_path = os.path.join(PROJECT_ROOT, 'config.yaml')
-try:
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    DEFAULT_LOG_LEVEL = config['SYSTEM']['DEFAULT_LOG_LEVEL']
-    FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM: bool = config['SYSTEM']['FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM']
-    print(f"DEFAULT_LOG_LEVEL set to {DEFAULT_LOG_LEVEL}\nFORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM set to {FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM}")
-except ModuleNotFoundError as e:
-    print("ModuleNotFoundError when opening config.yaml")
-except Exception as e:
-    # Automatically run the entire program in debug mode if we lack configs.
-    DEFAULT_LOG_LEVEL = logging.DEBUG
-    FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM = True
-    print(f"Could not get debug level from config.yaml due to '{e}'.\nDefault LOG_LEVEL set to '{DEFAULT_LOG_LEVEL}'\nDefault FORCE_DEFAULT_LOG_LEVEL set to '{FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM}'")
+# Module attributes that are only set once _startup_once has run. See __getattr__
+_STARTUP_ATTRIBUTES = frozenset({
+    "debug_log_folder", "config", "DEFAULT_LOG_LEVEL",
+    "FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM", "DISABLE_LOG_RECORD_METADATA",
+})
+_STARTED = False
+_startup_lock = threading.Lock()
+
+def _startup_once() -> None:
+    """
+    Clean up old logs, create this run's log folder, and load the config.
+    This runs when the first Logger is created rather than at import,
+    so importing the module stays cheap for programs that never log.
+    """
+    global _STARTED, debug_log_folder, config, DEFAULT_LOG_LEVEL
+    global FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM, DISABLE_LOG_RECORD_METADATA
+    if _STARTED:
+        return
+    with _startup_lock:
+        if _STARTED: # Another thread finished startup while we waited for the lock.
+            return
+
+        # Clean up debug folders.
+        debug_folder = os.path.join(PROJECT_ROOT, "debug_logs")
+        _clean_up_debug_folder(debug_folder)
+
+        # Create a folder for current instantiation of the class.
+        # This should be created a-new every time the program is run or tested.
+        right_now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        debug_folder = os.path.join(debug_folder, right_now)
+        os.makedirs(debug_folder, exist_ok=True)
+        debug_log_folder = debug_folder
+
+        # Import DEBUG config
+        # NOTE We do a separate yaml import to avoid circular imports with the config file.
+        try:
+            config = _load_config(config_path)
+            DEFAULT_LOG_LEVEL = config['SYSTEM']['DEFAULT_LOG_LEVEL']
+            FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM = config['SYSTEM']['FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM']
+            DISABLE_LOG_RECORD_METADATA = config['SYSTEM'].get('DISABLE_LOG_RECORD_METADATA', False)
+            print(f"DEFAULT_LOG_LEVEL set to {DEFAULT_LOG_LEVEL}\nFORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM set to {FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM}")
+        except Exception as e:
+            # Automatically run the entire program in debug mode if we lack configs.
+            config = None
+            DEFAULT_LOG_LEVEL = logging.DEBUG
+            FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM = True
+            DISABLE_LOG_RECORD_METADATA = False
+            print(f"Could not get debug level from config.yaml due to '{e}'.\nDefault LOG_LEVEL set to '{DEFAULT_LOG_LEVEL}'\nDefault FORCE_DEFAULT_LOG_LEVEL set to '{FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM}'")
+
+        # Resolve level names like "DEBUG" to their int value once, rather than on every Logger construction.
+        if isinstance(DEFAULT_LOG_LEVEL, str):
+            DEFAULT_LOG_LEVEL = logging.getLevelName(DEFAULT_LOG_LEVEL.upper())
+            if not isinstance(DEFAULT_LOG_LEVEL, int):
+                print(f"Unknown DEFAULT_LOG_LEVEL in config.yaml. DEFAULT_LOG_LEVEL set to '{logging.DEBUG}'")
+                DEFAULT_LOG_LEVEL = logging.DEBUG
+
+        # Walking the folder can take a while, so do it in the background.
+        # Set LOGGER_SKIP_SWEEP=1 to skip it entirely (e.g. in CI).
+        if os.environ.get("LOGGER_SKIP_SWEEP") != "1":
+            threading.Thread(target=_sweep_once, daemon=True).start()
+
+        # None of our formats use thread or process info, so skip collecting it for every record.
+        # NOTE These are global logging settings, so they also apply to any other loggers in the program.
+        if DISABLE_LOG_RECORD_METADATA:
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.logMultiprocessing = False
+
+        _STARTED = True
+
+
+def __getattr__(name: str):
+    """
+    Run startup the first time one of its module attributes (e.g. DEFAULT_LOG_LEVEL) is read.
+    """
+    if name in _STARTUP_ATTRIBUTES:
+        _startup_once()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # NOTE
 # CRITICAL = 50
@@ -124,6 +270,191 @@ except Exception as e:
 # DEBUG = 10
 # NOTSET = 0
 
+# Folders for each logger name in this run, so each one is only built and created once.
+_FOLDERS: dict[str, str] = {}
+
+def _get_logger_folder(logger_name: str) -> str:
+    """
+    Get the folder for the logger_name's log files, creating it the first time it's asked for.
+    """
+    folder = _FOLDERS.get(logger_name)
+    if folder is None:
+        folder = os.path.join(debug_log_folder, logger_name)
+        os.makedirs(folder, exist_ok=True)
+        _FOLDERS[logger_name] = folder
+    return folder
+
+# Console handlers for each formatter, shared by every Logger that uses that formatter.
+_CONSOLE_HANDLERS: dict[logging.Formatter, logging.StreamHandler] = {}
+
+def _get_console_handler(formatter: logging.Formatter) -> logging.StreamHandler:
+    """
+    Get the console handler for the formatter, creating it the first time it's asked for.
+    """
+    console_handler = _CONSOLE_HANDLERS.get(formatter)
+    if console_handler is None:
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.DEBUG)
+        console_handler.setFormatter(formatter)
+        _CONSOLE_HANDLERS[formatter] = console_handler
+    return console_handler
+
+# Every Logger's records go through this one queue, and one listener thread writes them out.
+# Records are routed by logger name to that Logger's own file and console handlers.
+# NOTE SimpleQueue.put is reentrant, unlike queue.Queue.put, so the shutdown signal handler can log
+# even if the signal arrived while the main thread was in the middle of putting a record on the queue.
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_ROUTES: dict[str, tuple[logging.Handler, ...]] = {}
+_listener: logging.handlers.QueueListener = None
+_listener_stopped = False # Once stopped at exit, records are always routed directly.
+# Reentrant for the same reason, as the signal handler stops the listener.
+_listener_lock = threading.RLock()
+
+def _route(record: logging.LogRecord) -> None:
+    """
+    Hand the record to the handlers of the Logger it was logged on.
+    """
+    for handler in _ROUTES.get(record.name, ()):
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+class _RoutingHandler(logging.Handler):
+    """
+    The shared listener's only handler. Sends each record on to its own Logger's handlers.
+    """
+    def handle(self, record: logging.LogRecord) -> bool:
+        _route(record)
+        return True
+
+class _RoutedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts records on the shared queue while the listener is running.
+    Once it's been stopped (e.g. at exit), records are routed directly, so nothing is stranded in the queue.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            _route(record)
+        else:
+            super().emit(record)
+
+def _start_listener_once() -> None:
+    """
+    Start the shared listener, the first time a Logger creates its handlers.
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is None and not _listener_stopped:
+            # Only publish the listener once it's running, so stopping it from a signal handler never sees a half-started one.
+            listener = logging.handlers.QueueListener(_LOG_QUEUE, _RoutingHandler())
+            listener.start()
+            _listener = listener
+            atexit.register(_stop_listener)
+
+def _stop_listener() -> None:
+    """
+    Drain the log queue and flush every Logger's handlers.
+    Anything logged afterwards is written to the handlers directly. Safe to call more than once.
+    """
+    global _listener, _listener_stopped
+    with _listener_lock:
+        listener, _listener = _listener, None
+        _listener_stopped = True
+        if listener is None:
+            return
+        listener.stop()
+    # Route anything that was queued while the listener was stopping.
+    while True:
+        try:
+            _route(_LOG_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    for handlers in list(_ROUTES.values()):
+        for handler in handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError): # Like logging.shutdown, e.g. when the console stream is already closed.
+                pass
+
+def flush_and_list_run_folders() -> list[str]:
+    """
+    Write out every queued and buffered record, then return the folders this run's loggers have created.
+    Used to clean up after a crash, when a log whose records were still in memory would otherwise look empty.
+    Anything logged afterwards is written directly, without the queue.
+    """
+    _stop_listener()
+    return list(_FOLDERS.values())
+
+def _unknown_caller(*args, **kwargs) -> tuple[str, int, str, None]:
+    """
+    Stand-in for logging.Logger.findCaller, for loggers whose format doesn't show the caller.
+    Skips the stack walk, which is the most expensive part of a log call.
+    """
+    return "(unknown file)", 0, "(unknown function)", None
+
+# Batch id shared by every Logger.get(logger_name="prompt") call for each prompt_name.
+_SHARED_PROMPT_BATCH_IDS: dict[str, str] = {}
+
+# Live Logger instances, cleaned up together when the program receives a shutdown signal.
+_registered_loggers: "weakref.WeakSet[Logger]" = weakref.WeakSet()
+_signals_installed = False
+_shutting_down = False
+# Names of the signals we handle, looked up without building a signal.Signals enum during shutdown.
+_SIGNAME = {int(s): s.name for s in (signal.SIGINT, signal.SIGTERM)}
+
+def _install_signal_handlers_once() -> None:
+    """
+    Register the signal handlers, the first time a Logger is created on the main thread.
+    These will be called in case of forced shutdowns and keyboard interrupts.
+    Normal exits are covered by the shared listener's atexit hook instead.
+    """
+    global _signals_installed
+    if _signals_installed:
+        return
+    # signal.signal raises ValueError off the main thread. Leave it to the next Logger made on the main thread.
+    if threading.current_thread() is not threading.main_thread():
+        return
+    signal.signal(signal.SIGINT, _handle_shutdown_signal)
+    signal.signal(signal.SIGTERM, _handle_shutdown_signal)
+    _signals_installed = True
+
+def _handle_shutdown_signal(signum: int, frame) -> None:
+    """
+    Handle shutdown signals gracefully, by cleaning up every registered Logger before exiting.
+    """
+    global _shutting_down
+    loggers = list(_registered_loggers)
+
+    if _shutting_down:
+        for logger in loggers:
+            logger.logger.warning("Received second shutdown signal! Forcing exit...")
+        sys.exit(1)
+
+    _shutting_down = True
+    signal_name = _SIGNAME.get(signum, str(signum))
+    exit_code = 0
+
+    for logger in loggers:
+        logger.logger.info(f"Received shutdown signal: {signal_name}")
+        logger.logger.info("Starting graceful shutdown...")
+
+    # Stop the shared listener once, so every queued record is written before anything gets closed.
+    _stop_listener()
+
+    for logger in loggers:
+        try:
+            logger._cleanup()
+        except Exception as e:
+            logger.logger.error(f"Error during cleanup: {e}")
+            exit_code = 1
+            continue
+
+        logger.logger.info("Graceful shutdown completed")
+
+    # Only close the handlers once every logger has finished writing.
+    logging.shutdown()
+    sys.exit(exit_code)
+
+
 class Logger:
     """
     Create a logger with dynamic log folder generation and routing capabilities.
@@ -132,8 +463,8 @@ class Logger:
     Parameters:
         logger_name (str): Name for the logger. Defaults to the program's name (top-level directory's name).
         prompt_name (str): Name of a prompt. Used by the prompt logger. Defaults to "prompt_log".
-        batch_id (str): The logger's batch id. Used by the prompt logger. Defaults to random UUID4 string.
-        current_time (datetime): The time a logger is initialized. Defaults to now() in "%Y-%m-%d_%H-%M-%S" format.
+        batch_id (str): The logger's batch id. Used by the prompt logger. Defaults to a new random UUID4 string for each prompt logger.
+        current_time (str): The time a logger is initialized. Defaults to now() in "%Y-%m-%d_%H-%M-%S" format.
         log_level (int): The logging level. Defaults to DEFAULT_LOG_LEVEL from config or logging.DEBUG if config is unavailable.
         stacklevel (int): The depth of function calls for determining log origin. Defaults to None.
 
@@ -148,24 +479,26 @@ class Logger:
         logger (logging.Logger): The underlying Python logger object.
         filename (str): The name of the log file.
         filepath (str): The full path to the log file.
-        file_handler (logging.FileHandler): Handler for writing logs to a file.
-        asterisk (str): Formatting string with asterisks.
-        line (str): Formatting string with dashes.
+        file_handler (BufferedFileHandler): Buffered handler for writing logs to a file.
+        asterisk (str): Formatting string with asterisks. Class-level constant.
+        line (str): Formatting string with dashes. Class-level constant.
         exception_symbol (str): Symbol used for exception logging.
-        shutting_down (bool): Flag to indicate if the logger is shutting down.
+        _level_enabled (Callable[[int], bool]): The underlying logger's bound isEnabledFor method.
+        _info, _debug, _warning, _error, _critical, _exception (Callable): The underlying logger's bound logging methods.
 
     Methods:
-        info(message, f=False, q=True, t=None, off=False): Log a message with severity 'INFO'.
-        debug(message, f=False, q=True, t=None, off=False): Log a message with severity 'DEBUG'.
-        warning(message, f=False, q=True, t=None, off=False): Log a message with severity 'WARNING'.
-        error(message, f=False, q=True, t=None, off=False): Log a message with severity 'ERROR'.
-        critical(message, f=False, q=True, t=None, off=False): Log a message with severity 'CRITICAL'.
-        exception(message, f=False, q=True, t=None, off=False): Log a message with severity 'ERROR', including exception information.
-        _setup_signal_handlers(): Register signal handlers for graceful shutdown.
-        _handle_shutdown_signal(signum, frame): Handle shutdown signals.
-        _cleanup(): Clean up logging resources on exit.
+        info(message, *args, f=False, q=True, t=None, off=False): Log a message with severity 'INFO'.
+        debug(message, *args, f=False, q=True, t=None, off=False): Log a message with severity 'DEBUG'.
+        warning(message, *args, f=False, q=True, t=None, off=False): Log a message with severity 'WARNING'.
+        error(message, *args, f=False, q=True, t=None, off=False): Log a message with severity 'ERROR'.
+        critical(message, *args, f=False, q=True, t=None, off=False): Log a message with severity 'CRITICAL'.
+        exception(message, *args, f=False, q=True, t=None, off=False): Log a message with severity 'ERROR', including exception information.
+        get(logger_name, prompt_name, log_level, stacklevel): Get the shared Logger for these arguments.
+        _warn_if_settings_differ(log_level, stacklevel): Warn when a cached Logger is asked for with different settings.
+        _build(logger_name, prompt_name, batch_id, current_time, log_level, stacklevel): Set up the Logger, once per instance.
+        _cleanup(): Flush this logger's handlers on shutdown.
         _f(message): Format the message with asterisks.
-        _message_template(message, method, f, q, t, off): Template for formatting and logging messages.
+        _message_template(message, level, f, q, t, off, args, exc_info): Template for formatting and logging messages.
 
     Example:
         >>> from logger.logger import Logger
@@ -180,123 +513,206 @@ class Logger:
         - FATAL is an alias for CRITICAL, and WARN is an alias for WARNING.
         - The 'q' parameter in logging methods is deprecated due to Python's inability to differentiate 
           between regular and formatted strings at runtime.
-        - The class includes signal handling for graceful shutdown on SIGINT and SIGTERM signals.
+        - Prefer passing arguments lazily, e.g. logger.debug("x=%s", x), over f-strings like logger.debug(f"x={x}").
+          The f-string is always built, even when the level is disabled and the message is thrown away.
+        - f, q, t and off are keyword-only, as any extra positional arguments are used as message args.
+        - The module installs one SIGINT/SIGTERM handler for the whole process, which gracefully shuts down every live Logger.
+        - Loggers are cached by (logger_name, prompt_name, batch_id). Constructing a Logger with the same
+          values returns the existing instance unchanged. A different log_level or stacklevel prints a warning and is ignored.
     """
+    # Fixed attribute slots instead of a per-instance __dict__.
+    __slots__ = (
+        "logger_name", "prompt_name", "batch_id", "current_time", "logger_folder", "log_level",
+        "stacklevel", "logger", "filename", "filepath", "file_handler",
+        "exception_symbol", "_level_enabled", "_inited", "__weakref__",
+        "_info", "_debug", "_warning", "_error", "_critical", "_exception",
+    )
+
+    # Formatters are built once here and shared by every Logger, rather than re-parsed per construction.
+    _DEFAULT_FMT = PrecompiledFormatter('%(asctime)s - %(levelname)s - %(filename)s: %(lineno)d - %(message)s')
+    _PROMPT_FMT = PrecompiledFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Formatting constants.
+    asterisk = "\n********************\n"
+    line = "\n--------------------\n"
+
+    def __new__(cls,
+                logger_name: str=PROGRAM_NAME,
+                prompt_name: str="prompt_log",
+                batch_id: str=None,
+                *args, **kwargs
+               ):
+        # Return the existing Logger for this name, prompt and batch instead of building a new one.
+        key = _cache_key(logger_name, prompt_name, batch_id)
+        if key is None:
+            return super().__new__(cls)
+        with _LOGGER_CACHE_LOCK:
+            logger = _LOGGER_CACHE.get(key)
+            if logger is None:
+                logger = _LOGGER_CACHE[key] = super().__new__(cls)
+        return logger
+
+    @classmethod
+    def get(cls,
+            logger_name: str=PROGRAM_NAME,
+            prompt_name: str="prompt_log",
+            log_level: int=None,
+            stacklevel: int=None
+           ) -> "Logger":
+        """
+        Get the shared Logger for these arguments, building it on the first call.
+        Repeat calls are a single lookup in the same cache __new__ uses, keyed by (logger_name, prompt_name, batch_id),
+        skipping __new__ and __init__ entirely.
+        log_level and stacklevel only apply when the Logger is first built. Asking for the same Logger
+        with different ones prints a warning and returns the existing Logger unchanged.
+        NOTE Every Logger.get(logger_name="prompt") call with the same prompt_name shares one batch.
+        Construct prompt loggers directly to get a new batch each time.
+
+        Example:
+            >>> logger = Logger.get(logger_name="my_app")
+            >>> logger is Logger.get(logger_name="my_app")
+            True
+        """
+        batch_id = None
+        if logger_name == "prompt":
+            with _LOGGER_CACHE_LOCK:
+                batch_id = _SHARED_PROMPT_BATCH_IDS.get(prompt_name)
+                if batch_id is None:
+                    batch_id = _SHARED_PROMPT_BATCH_IDS[prompt_name] = make_id()
+
+        logger = _LOGGER_CACHE.get(_cache_key(logger_name, prompt_name, batch_id))
+        if logger is None or not getattr(logger, "_inited", False):
+            return cls(logger_name=logger_name, prompt_name=prompt_name, batch_id=batch_id, log_level=log_level, stacklevel=stacklevel)
+        logger._warn_if_settings_differ(log_level, stacklevel)
+        return logger
 
     def __init__(self,
                  logger_name: str=PROGRAM_NAME,
                  prompt_name: str="prompt_log",
-                 batch_id: str=make_id(),
-                 current_time: datetime=datetime.now().strftime("%Y-%m-%d_%H-%M-%S"),
-                 log_level: int=DEFAULT_LOG_LEVEL,
+                 batch_id: str=None,
+                 current_time: str=None,
+                 log_level: int=None,
                  stacklevel: int=None
                 ):
+        if getattr(self, "_inited", False): # Already built and returned from the cache by __new__.
+            self._warn_if_settings_differ(log_level, stacklevel)
+            return
+        with _LOGGER_CACHE_LOCK:
+            if getattr(self, "_inited", False): # Another thread finished building it while we waited.
+                self._warn_if_settings_differ(log_level, stacklevel)
+                return
+            try:
+                self._build(logger_name, prompt_name, batch_id, current_time, log_level, stacklevel)
+            except BaseException:
+                # Don't leave a half-built Logger in the cache for the next caller to get.
+                key = _cache_key(logger_name, prompt_name, batch_id)
+                if key is not None and _LOGGER_CACHE.get(key) is self:
+                    del _LOGGER_CACHE[key]
+                _registered_loggers.discard(self)
+                raise
+            # Only mark it as built once everything above succeeded.
+            self._inited = True
+
+    def _warn_if_settings_differ(self, log_level: int, stacklevel: int) -> None:
+        """
+        Warn when an existing Logger is asked for again with a different log_level or stacklevel.
+        The existing Logger is shared, so it keeps the settings it was built with.
+        """
+        if log_level is not None and log_level != self.log_level and not FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM:
+            print(f"WARNING: Logger '{self.logger_name}' already exists with log_level {self.log_level}. Ignoring log_level {log_level}.")
+        if stacklevel is not None and stacklevel != self.stacklevel:
+            print(f"WARNING: Logger '{self.logger_name}' already exists with stacklevel {self.stacklevel}. Ignoring stacklevel {stacklevel}.")
+
+    def _build(self,
+               logger_name: str,
+               prompt_name: str,
+               batch_id: str,
+               current_time: str,
+               log_level: int,
+               stacklevel: int
+              ) -> None:
+        """
+        Set up the Logger. Called once per instance, by __init__.
+        """
+        _startup_once()
+
         self.logger_name = logger_name
         self.prompt_name = prompt_name
+        # NOTE Defaults are filled in here, as default arguments are only evaluated once at class definition.
         self.batch_id = batch_id
-        self.current_time = current_time
-        self.logger_folder = debug_log_folder
-        self.log_level = log_level if not FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM else DEFAULT_LOG_LEVEL
+        self.current_time = current_time or datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self.log_level = DEFAULT_LOG_LEVEL if log_level is None or FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM else log_level
         self.stacklevel = stacklevel
         self.logger: logging.Logger = None
         self.filename = None
         self.filepath = None
         self.file_handler = None
-        # Formatting variables.
-        self.asterisk = "\n********************\n"
-        self.line = "\n--------------------\n"
         self.exception_symbol = None
         # Register signal handlers
         # This make it so log files are written even when the program errors or is stopped.
-        self._setup_signal_handlers()
-        self.shutting_down = False # Keep track of shutdown status
+        _install_signal_handlers_once()
+        _registered_loggers.add(self)
 
         # Create the specified log folder if it doesn't exist.
         # This assures that we always have a valid path for the log file.
-        self.logger_folder = os.path.join(self.logger_folder, self.logger_name)
-        if not os.path.exists(self.logger_folder):
-            os.makedirs(self.logger_folder)
+        self.logger_folder = _get_logger_folder(self.logger_name)
 
         # Determine properties of the logger based on its name.
-        match logger_name:
-            case logger_name if logger_name == PROGRAM_NAME: # If logger_name is the program's name
-                self.logger = logging.getLogger(f"{PROGRAM_NAME}_logger")
-                filename = f"{PROGRAM_NAME}_debug_log_{self.current_time}.log"
-                formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(filename)s: %(lineno)d - %(message)s')
-                self.stacklevel = self.stacklevel or 2 # We make stacklevel=2 as otherwise it'll give the filename and line numbers from the logger class itself.
-
-            case "prompt":
-                self.logger =  logging.getLogger(f"prompt_logger_for_{self.prompt_name}_batch_id_{self.batch_id}")
-                filename =  f"{self.prompt_name}_{self.batch_id}_{self.current_time}.log"
-                formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s: %(lineno)d - %(message)s')
-                self.stacklevel = self.stacklevel or 1 # Force the stack to log the LLM engine's name
-
-            case _: # All other specialized loggers.
-                self.logger = logging.getLogger(f"{self.logger_name}_logger")
-                filename = f"{self.logger_name}_debug_log_{self.current_time}.log"
-                formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(filename)s: %(lineno)d - %(message)s')
-                self.stacklevel = self.stacklevel or 2
+        if logger_name == "prompt":
+            self.batch_id = self.batch_id or make_id() # Only the prompt logger needs a batch id.
+            self.logger = logging.getLogger(f"prompt_logger_for_{self.prompt_name}_batch_id_{self.batch_id}")
+            filename = f"{self.prompt_name}_{self.batch_id}_{self.current_time}.log"
+            formatter = self._PROMPT_FMT
+            self.stacklevel = self.stacklevel or 1
+            # The prompt format doesn't show where the call came from, so don't look it up.
+            self.logger.findCaller = _unknown_caller
+
+        else: # The program's logger and all other specialized loggers.
+            self.logger = logging.getLogger(f"{self.logger_name}_logger")
+            filename = f"{self.logger_name}_debug_log_{self.current_time}.log"
+            formatter = self._DEFAULT_FMT
+            self.stacklevel = self.stacklevel or 2 # We make stacklevel=2 as otherwise it'll give the filename and line numbers from the logger class itself.
 
         # Create the logger itself.
         self.logger.setLevel(self.log_level) # Set the default log level.
         self.logger.propagate = False # Prevent logs from being handled by parent loggers
+        # Bind once, so disabled log calls return after a single cached level check.
+        self._level_enabled = self.logger.isEnabledFor
+        # Bind the logging methods once, instead of creating a bound method on every call.
+        self._info, self._debug, self._warning, self._error, self._critical, self._exception = (
+            self.logger.info, self.logger.debug, self.logger.warning,
+            self.logger.error, self.logger.critical, self.logger.exception
+        )
 
         if not self.logger.handlers:
             # Create handlers (file and console)
             self.filepath = os.path.join(self.logger_folder, filename)
-            file_handler = logging.FileHandler(self.filepath)
-            console_handler = logging.StreamHandler()
+            self.file_handler = BufferedFileHandler(
+                self.filepath,
+                max_bytes=max_size_in_megabytes * 1024 * 1024 // (log_file_backup_count + 1),
+                backup_count=log_file_backup_count
+            )
+            console_handler = _get_console_handler(formatter) # Shared with every other Logger using this formatter.
 
             # Set level for handlers
-            file_handler.setLevel(logging.DEBUG)
-            console_handler.setLevel(logging.DEBUG)
+            self.file_handler.setLevel(logging.DEBUG)
 
             # Create formatters and add it to handlers
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
-
-            # Add handlers to the logger
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+            self.file_handler.setFormatter(formatter)
 
-    def _setup_signal_handlers(self):
-        """
-        Register the signal handlers.
-        These will be called in case of forced shutdowns and keyboard interrupts.
-        """
-        signal.signal(signal.SIGINT, self._handle_shutdown_signal)
-        signal.signal(signal.SIGTERM, self._handle_shutdown_signal)
-
-    def _handle_shutdown_signal(self, signum: int, frame) -> None:
-        """
-        Handle shutdown signals gracefully
-        """
-        if self.shutting_down:
-            self.logger.warning("Received second shutdown signal! Forcing exit...")
-            sys.exit(1)
-            
-        self.shutting_down = True
-        signal_name = signal.Signals(signum).name
-        
-        self.logger.info(f"Received shutdown signal: {signal_name}")
-        self.logger.info("Starting graceful shutdown...")
-        
-        try:
-            self._cleanup()
-        except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
-            sys.exit(1)
-            
-        self.logger.info("Graceful shutdown completed")
-        sys.exit(0)
+            # Route records through the shared queue so the caller only pays for a queue append.
+            # The shared listener writes them to this logger's file and console from a background thread.
+            _ROUTES[self.logger.name] = (self.file_handler, console_handler)
+            self.logger.addHandler(_RoutedQueueHandler(_LOG_QUEUE))
+            _start_listener_once()
 
     def _cleanup(self) -> None:
         """
-        Cleanup logging resources on exit.
+        Flush this logger's handlers on shutdown.
+        They're closed afterwards by logging.shutdown(), once every logger has been cleaned up.
         """
-        for handler in self.logger.handlers:
+        for handler in _ROUTES.get(self.logger.name, ()):
             handler.flush()
-        logging.shutdown()
 
     def _f(self, message: str) -> str:
         """
@@ -304,84 +720,124 @@ class Logger:
         The number of asterisks will have the same length as the input message, 
         with a maximum character length of 100.
         """
-        self.asterisk = '*' * len(message)
-        # Cut off the asterisk string at 50 characters to prevent wasted log space.
-        self.asterisk = self.asterisk[:100] if len(message) > 100 else self.asterisk 
-        return f"\n{self.asterisk}\n{message}\n{self.asterisk}\n"
+        # Slice a precomputed bar rather than building one as long as the message.
+        bar = _ASTERISKS[:min(len(message), 100)]
+        return f"\n{bar}\n{message}\n{bar}\n"
 
-    def _message_template(self, message: str, method: Callable, f: bool, q: bool, t: float, off: bool) -> None:
+    def _message_template(self, message: str, level: int, f: bool, q: bool, t: float, off: bool, args: tuple=(), exc_info: bool=False) -> None:
         """
+        level is the numeric logging level to log the message at, e.g. logging.INFO.\n
+        args are merged into message with %-formatting, but only if the message is actually logged.\n
         f is for formatting with self.asterisk.\n
         q is for automatically putting single quotes around f-string curly brackets
         t is for pausing the program by a specified number of seconds after the message has been printed to console.\n
-        off turns off the logger for this message.
+        off turns off the logger for this message.\n
+        exc_info adds the current exception's traceback to the message, same as logging.Logger.exception.
         NOTE q is deprecated due to Python's inability to tell the difference between a regular and formatted string at runtime.
         """
-        if not off:
-
-            if not f: # We move up the stack by 1 because it's a nested method.
-                method(message, stacklevel=self.stacklevel+1)
-            else:
-                method(self._f(message), stacklevel=self.stacklevel+1)
-            if t:
-                time.sleep(t)
-
-    def info(self, message, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
+        # Check the level first, so disabled messages never get formatted.
+        if off or not self._level_enabled(level):
+            return
+
+        if f:
+            message = self._f(message)
+        # We move up the stack by 1 because it's a nested method.
+        self.logger.log(level, message, *args, exc_info=exc_info, stacklevel=self.stacklevel+1)
+        if t:
+            time.sleep(t)
+
+    def info(self, message, *args, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
         """
+        args are merged into message with %-formatting, but only if the message is actually logged.\n
         f is for formatting with self.asterisk.\n
         q is for automatically putting single quotes around f-string curly brackets
         t is for pausing the program by a specified number of seconds after the message has been printed to console.\n
         off turns off the logger for this message.
         NOTE q is deprecated due to Python's inability to tell the difference between a regular and formatted string at runtime.
         """
-        self._message_template(message, self.logger.info, f, q, t, off)
-
-    def debug(self, message, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
+        if off or not self._level_enabled(logging.INFO):
+            return
+        if not f and not t: # Fast path: no formatting or pausing, so skip the template.
+            self._info(message, *args, stacklevel=self.stacklevel)
+            return
+        self._message_template(message, logging.INFO, f, q, t, off, args)
+
+    def debug(self, message, *args, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
         """
+        args are merged into message with %-formatting, but only if the message is actually logged.\n
         f is for formatting with self.asterisk.\n
         q is for automatically putting single quotes around f-string curly brackets
         t is for pausing the program by a specified number of seconds after the message has been printed to console.\n
         off turns off the logger for this message.\n
         NOTE q is deprecated due to Python's inability to tell the difference between a regular and formatted string at runtime.
         """
-        self._message_template(message, self.logger.debug, f, q, t, off)
-
-    def warning(self, message, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
+        if off or not self._level_enabled(logging.DEBUG):
+            return
+        if not f and not t: # Fast path: no formatting or pausing, so skip the template.
+            self._debug(message, *args, stacklevel=self.stacklevel)
+            return
+        self._message_template(message, logging.DEBUG, f, q, t, off, args)
+
+    def warning(self, message, *args, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
         """
+        args are merged into message with %-formatting, but only if the message is actually logged.\n
         f is for formatting with self.asterisk.\n
         q is for automatically putting single quotes around f-string curly brackets
         t is for pausing the program by a specified number of seconds after the message has been printed to console.\n
         off turns off the logger for this message.\n
         NOTE q is deprecated due to Python's inability to tell the difference between a regular and formatted string at runtime.
         """
-        self._message_template(message, self.logger.warning, f, q, t, off)
-
-    def error(self, message, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
+        if off or not self._level_enabled(logging.WARNING):
+            return
+        if not f and not t: # Fast path: no formatting or pausing, so skip the template.
+            self._warning(message, *args, stacklevel=self.stacklevel)
+            return
+        self._message_template(message, logging.WARNING, f, q, t, off, args)
+
+    def error(self, message, *args, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
         """
+        args are merged into message with %-formatting, but only if the message is actually logged.\n
         f is for formatting with self.asterisk.\n
         q is for automatically putting single quotes around f-string curly brackets
         t is for pausing the program by a specified number of seconds after the message has been printed to console.\n
         off turns off the logger for this message.\n
         NOTE q is deprecated due to Python's inability to tell the difference between a regular and formatted string at runtime.
         """
-        self._message_template(message, self.logger.error, f, q, t, off)
-
-    def critical(self, message, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
+        if off or not self._level_enabled(logging.ERROR):
+            return
+        if not f and not t: # Fast path: no formatting or pausing, so skip the template.
+            self._error(message, *args, stacklevel=self.stacklevel)
+            return
+        self._message_template(message, logging.ERROR, f, q, t, off, args)
+
+    def critical(self, message, *args, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
         """
+        args are merged into message with %-formatting, but only if the message is actually logged.\n
         f is for formatting with self.asterisk.\n
         q is for automatically putting single quotes around f-string curly brackets
         t is for pausing the program by a specified number of seconds after the message has been printed to console.\n
         off turns off the logger for this message.\n
         NOTE q is deprecated due to Python's inability to tell the difference between a regular and formatted string at runtime.
         """
-        self._message_template(message, self.logger.critical, f, q, t, off)
-
-    def exception(self, message, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
+        if off or not self._level_enabled(logging.CRITICAL):
+            return
+        if not f and not t: # Fast path: no formatting or pausing, so skip the template.
+            self._critical(message, *args, stacklevel=self.stacklevel)
+            return
+        self._message_template(message, logging.CRITICAL, f, q, t, off, args)
+
+    def exception(self, message, *args, f: bool=False, q: bool=True, t: float=None, off: bool=False) -> None:
         """
+        args are merged into message with %-formatting, but only if the message is actually logged.\n
         f is for formatting with self.asterisk.\n
         q is for automatically putting single quotes around f-string curly brackets
         t is for pausing the program by a specified number of seconds after the message has been printed to console.\n
         off turns off the logger for this message.\n
         NOTE q is deprecated due to Python's inability to tell the difference between a regular and formatted string at runtime.
         """
-        self._message_template(message, self.logger.exception, f, q, t, off)
+        if off or not self._level_enabled(logging.ERROR):
+            return
+        if not f and not t: # Fast path: no formatting or pausing, so skip the template.
+            self._exception(message, *args, stacklevel=self.stacklevel)
+            return
+        self._message_template(message, logging.ERROR, f, q, t, off, args, exc_info=True)
@@ -0,0 +1,107 @@
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+import types
+
+import pytest
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# This repo is meant to be checked out as the 'logger' folder of a project, which is how its modules import each other.
+# Register the checkout under that name without running its __init__, so the utils can be imported on their own.
+if "logger" not in sys.modules:
+    _logger_package = types.ModuleType("logger")
+    _logger_package.__path__ = [REPO_ROOT]
+    sys.modules["logger"] = _logger_package
+
+
+DEFAULT_CONFIG = """\
+SYSTEM:
+  DEFAULT_LOG_LEVEL: 10
+  FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM: False
+"""
+
+
+class Project:
+    """
+    A throwaway project with a copy of this repo as its 'logger' folder.
+    Loggers clean up and write to the folder above the module, so they're run here in a subprocess
+    instead of in the test process.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        shutil.copytree(
+            REPO_ROOT, os.path.join(root, "logger"),
+            ignore=shutil.ignore_patterns(".git", "tests", "debug_logs", "__pycache__", "*.patch", "*.jsonl"),
+        )
+        self.write_config(DEFAULT_CONFIG)
+
+    @property
+    def config_path(self) -> str:
+        return os.path.join(self.root, "config.yaml")
+
+    def write_config(self, text: str) -> None:
+        with open(self.config_path, "w") as f:
+            f.write(textwrap.dedent(text))
+
+    def _process_args(self, code: str) -> dict:
+        return dict(
+            args=[sys.executable, "-c", textwrap.dedent(code)], cwd=self.root,
+            env=dict(os.environ, PYTHONPATH=self.root, LOGGER_SKIP_SWEEP="1"), stdin=subprocess.DEVNULL,
+        )
+
+    def run(self, code: str, timeout: float = 60, check: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run code in a new Python process at the project root, with stdin detached from any terminal.
+        """
+        result = subprocess.run(**self._process_args(code), capture_output=True, text=True, timeout=timeout)
+        if check:
+            assert result.returncode == 0, result.stdout + result.stderr
+        return result
+
+    def start(self, code: str) -> subprocess.Popen:
+        """
+        Start code in a new Python process like run, without waiting for it or keeping its output.
+        """
+        return subprocess.Popen(**self._process_args(code), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def log_files(self, logger_folder: str) -> list[str]:
+        """
+        The log files this project's runs wrote to the folder for logger_folder, oldest name first.
+        """
+        pattern = os.path.join(self.root, "debug_logs", "**", logger_folder, "*.log")
+        return sorted(glob.glob(pattern, recursive=True))
+
+    def read_logs(self, logger_folder: str) -> str:
+        text = ""
+        for path in self.log_files(logger_folder):
+            with open(path) as f:
+                text += f.read()
+        return text
+
+
+@pytest.fixture
+def make_project(tmp_path):
+    """
+    Make as many separate projects as a test needs, e.g. to run several processes that would otherwise clean up each other's logs.
+    """
+    count = 0
+
+    def make() -> Project:
+        nonlocal count
+        count += 1
+        root = tmp_path / f"project_{count}"
+        root.mkdir()
+        return Project(str(root))
+
+    return make
+
+
+@pytest.fixture
+def project(make_project) -> Project:
+    return make_project()
@@ -0,0 +1,138 @@
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from logger.utils.logger import buffered_file_handler
+from logger.utils.logger.buffered_file_handler import BufferedFileHandler
+
+
+def _record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def _read(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.fixture
+def make_handler():
+    handlers = []
+
+    def make(*args, **kwargs) -> BufferedFileHandler:
+        handler = BufferedFileHandler(*args, **kwargs)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(handler)
+        return handler
+
+    yield make
+    for handler in handlers:
+        handler.close()
+
+
+def test_close_writes_out_the_buffer(tmp_path):
+    path = str(tmp_path / "run.log")
+    handler = BufferedFileHandler(path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    handler.emit(_record("buffered"))
+    handler.close()
+
+    assert _read(path) == "buffered\n"
+    assert handler not in buffered_file_handler._open_handlers
+
+
+def test_one_thread_flushes_every_open_handler(tmp_path, make_handler):
+    handlers = [make_handler(str(tmp_path / f"run_{number}.log")) for number in range(20)]
+    flush_threads = [thread for thread in threading.enumerate() if thread.name == "BufferedFileHandlerFlush"]
+    assert len(flush_threads) == 1
+
+    for handler in handlers:
+        handler.emit(_record("periodic"))
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and not all(_read(handler.baseFilename) for handler in handlers):
+        time.sleep(0.05)
+
+    assert all(_read(handler.baseFilename) == "periodic\n" for handler in handlers)
+
+
+def test_backups_keep_the_log_extension(tmp_path, make_handler):
+    handler = make_handler(str(tmp_path / "run.log"), max_bytes=10, backup_count=2)
+
+    assert handler._backup_filename(1) == str(tmp_path / "run.1.log")
+    assert handler._backup_filename(2) == str(tmp_path / "run.2.log")
+
+
+def test_rotation_shifts_backups_and_drops_the_oldest(tmp_path, make_handler):
+    path = str(tmp_path / "run.log")
+    handler = make_handler(path, max_bytes=10, backup_count=2)
+
+    for message in ("first", "second", "third", "fourth"): # Each record is 6-7 characters, so each one rotates.
+        handler.emit(_record(message))
+    handler.flush()
+
+    assert _read(path) == "fourth\n"
+    assert _read(str(tmp_path / "run.1.log")) == "third\n"
+    assert _read(str(tmp_path / "run.2.log")) == "second\n"
+    assert sorted(os.listdir(tmp_path)) == ["run.1.log", "run.2.log", "run.log"]
+
+
+def test_records_fill_the_file_up_to_max_bytes(tmp_path, make_handler):
+    path = str(tmp_path / "run.log")
+    handler = make_handler(path, max_bytes=8, backup_count=1)
+
+    for message in ("abc", "def", "ghi"): # 4 characters each, so two fit.
+        handler.emit(_record(message))
+    handler.flush()
+
+    assert _read(str(tmp_path / "run.1.log")) == "abc\ndef\n"
+    assert _read(path) == "ghi\n"
+
+
+def test_record_larger_than_max_bytes_still_gets_written(tmp_path, make_handler):
+    path = str(tmp_path / "run.log")
+    handler = make_handler(path, max_bytes=4, backup_count=1)
+
+    handler.emit(_record("much too long"))
+    handler.flush()
+
+    assert _read(path) == "much too long\n"
+    assert not os.path.exists(str(tmp_path / "run.1.log"))
+
+
+def test_rotation_without_backups_starts_over(tmp_path, make_handler):
+    path = str(tmp_path / "run.log")
+    handler = make_handler(path, max_bytes=10, backup_count=0)
+
+    handler.emit(_record("first"))
+    handler.emit(_record("second"))
+    handler.flush()
+
+    assert _read(path) == "second\n"
+    assert os.listdir(tmp_path) == ["run.log"]
+
+
+def test_existing_file_size_counts_toward_max_bytes(tmp_path, make_handler):
+    path = str(tmp_path / "run.log")
+    with open(path, "w") as f:
+        f.write("old line\n")
+    handler = make_handler(path, max_bytes=10, backup_count=1)
+
+    handler.emit(_record("new"))
+    handler.flush()
+
+    assert _read(str(tmp_path / "run.1.log")) == "old line\n"
+    assert _read(path) == "new\n"
+
+
+def test_records_at_flush_level_reach_the_disk_immediately(tmp_path, make_handler):
+    path = str(tmp_path / "run.log")
+    handler = make_handler(path, flush_level=logging.ERROR)
+
+    handler.emit(_record("buffered", logging.INFO))
+    handler.emit(_record("flushed", logging.ERROR))
+
+    assert _read(path) == "buffered\nflushed\n"
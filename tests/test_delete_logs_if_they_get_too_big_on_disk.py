@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from logger.utils.logger import delete_logs_if_they_get_too_big_on_disk as module
+
+
+class _Terminal:
+    """
+    Stands in for sys.stdin on a terminal, reading from the read end of a pipe.
+    """
+
+    def __init__(self, read_fd: int):
+        self._file = os.fdopen(read_fd)
+
+    def isatty(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def readline(self) -> str:
+        return self._file.readline()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    stdin = _Terminal(read_fd)
+    monkeypatch.setattr(module.sys, "stdin", stdin)
+    with os.fdopen(write_fd, "w") as keyboard:
+        yield keyboard
+    stdin.close()
+
+
+def test_returns_false_without_a_terminal(monkeypatch, capsys):
+    monkeypatch.setattr(module.sys, "stdin", open(os.devnull))
+
+    assert module._handle_user_input() is False
+    assert "No terminal" in capsys.readouterr().out
+
+
+def test_returns_false_without_stdin(monkeypatch):
+    monkeypatch.setattr(module.sys, "stdin", None)
+
+    assert module._handle_user_input() is False
+
+
+@pytest.mark.skipif(os.name == "nt", reason="select can't wait on a pipe on Windows")
+def test_times_out_when_nothing_is_entered(terminal, capsys):
+    assert module._handle_user_input(timeout_seconds=0.2) is False
+    assert "Timeout" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(os.name == "nt", reason="select can't wait on a pipe on Windows")
+@pytest.mark.parametrize("answers, expected", [("y\n", True), ("N\n", False)])
+def test_reads_the_answer(terminal, answers, expected):
+    terminal.write(answers)
+    terminal.flush()
+
+    assert module._handle_user_input(timeout_seconds=5) is expected
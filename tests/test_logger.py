@@ -0,0 +1,292 @@
+import os
+
+import pytest
+
+
+def test_records_are_routed_to_their_own_logger(project):
+    project.run("""
+        from logger.logger import Logger, _stop_listener
+
+        first, second = Logger("first"), Logger("second")
+        for number in range(500):
+            first.info(f"first {number}")
+            second.info(f"second {number}")
+        _stop_listener()
+        first.info("after stop")
+    """)
+
+    first_log, second_log = project.read_logs("first"), project.read_logs("second")
+    assert first_log.count(" - first ") == 500 and "second" not in first_log
+    assert second_log.count(" - second ") == 500 and "first" not in second_log
+    assert "after stop" in first_log # Logged directly once the listener is stopped.
+
+
+def test_stop_listener_writes_everything_queued_to_disk(project):
+    result = project.run("""
+        from logger.logger import Logger, _stop_listener
+
+        logger = Logger("drained")
+        for number in range(2000):
+            logger.info("record %d", number)
+        _stop_listener()
+        with open(logger.filepath) as f:
+            print(f.read().count("record"))
+    """)
+
+    assert result.stdout.split()[-1] == "2000"
+
+
+def test_loggers_share_one_listener_and_one_flush_thread(project):
+    result = project.run("""
+        import threading
+        from logger.logger import Logger
+
+        loggers = [Logger("prompt", prompt_name=f"prompt_{number}") for number in range(50)]
+        for logger in loggers:
+            logger.info("hello")
+        print(threading.active_count())
+    """)
+
+    assert int(result.stdout.split()[-1]) <= 3 # The main thread, the queue listener and the flush thread.
+
+
+def test_shutdown_signal_while_logging_does_not_hang(make_project):
+    # The signal handler logs from the main thread, which may have been interrupted inside a queue put.
+    # That used to deadlock on the queue's lock, so run the race in several processes at once.
+    code = """
+        import os, signal, sys, threading, time
+        from logger.logger import Logger
+
+        logger = Logger("spin")
+        sys.stderr = open(os.devnull, "w")
+
+        def send_sigterm():
+            time.sleep(0.3)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        threading.Thread(target=send_sigterm, daemon=True).start()
+        while True:
+            logger.info("spin")
+    """
+    processes = [make_project().start(code) for _ in range(12)]
+    try:
+        return_codes = [process.wait(timeout=60) for process in processes]
+    finally:
+        for process in processes:
+            process.kill()
+
+    assert return_codes == [0] * len(processes)
+
+
+def test_config_cache_is_opt_in(project):
+    project.run("""
+        from logger.logger import _load_config
+
+        print(_load_config("config.yaml"))
+    """)
+
+    assert not os.path.exists(os.path.join(project.root, ".config.yaml.cache.json"))
+
+
+def test_config_cache_round_trip_and_invalidation(project):
+    result = project.run("""
+        import os
+        from logger.logger import _load_config
+
+        first = _load_config("config.yaml", use_cache=True)
+        print(os.path.exists(".config.yaml.cache.json"))
+
+        with open(".config.yaml.cache.json") as f:
+            header = f.readline()
+        with open(".config.yaml.cache.json", "w") as f: # A stale value that only the cache could return.
+            f.write(header + '{"SYSTEM": {"DEFAULT_LOG_LEVEL": 99}}')
+        print(_load_config("config.yaml", use_cache=True)["SYSTEM"]["DEFAULT_LOG_LEVEL"])
+
+        with open("config.yaml", "a") as f: # Changing the config changes its size, which invalidates the cache.
+            f.write("  EXTRA: 1\\n")
+        second = _load_config("config.yaml", use_cache=True)
+        print(second["SYSTEM"]["DEFAULT_LOG_LEVEL"], second["SYSTEM"]["EXTRA"], second == _load_config("config.yaml"))
+    """)
+
+    assert result.stdout.split()[-5:] == ["True", "99", "10", "1", "True"]
+
+
+def test_corrupt_config_cache_falls_back_to_the_yaml(project):
+    with open(os.path.join(project.root, ".config.yaml.cache.json"), "w") as f:
+        f.write("not json")
+
+    result = project.run("""
+        from logger.logger import _load_config
+
+        print(_load_config("config.yaml", use_cache=True)["SYSTEM"]["DEFAULT_LOG_LEVEL"])
+    """)
+
+    assert result.stdout.split()[-1] == "10"
+
+
+def test_same_name_returns_the_same_logger(project):
+    result = project.run("""
+        from logger.logger import Logger
+
+        print(Logger("app") is Logger("app"), Logger("app") is Logger("other"))
+        print(Logger("prompt", batch_id="batch") is Logger("prompt", batch_id="batch"))
+        print(Logger("prompt") is Logger("prompt")) # No batch id, so each one is a new batch.
+    """)
+
+    assert result.stdout.split()[-4:] == ["True", "False", "True", "False"]
+
+
+def test_logger_that_failed_to_build_is_not_cached(project):
+    result = project.run("""
+        import logger.logger as logger_module
+        from logger.logger import Logger
+
+        real_file_handler = logger_module.BufferedFileHandler
+        def failing_file_handler(*args, **kwargs):
+            logger_module.BufferedFileHandler = real_file_handler
+            raise OSError("disk full")
+        logger_module.BufferedFileHandler = failing_file_handler
+
+        try:
+            Logger("flaky")
+        except OSError:
+            print("failed once")
+        logger = Logger("flaky")
+        logger.info("built on retry")
+        print(logger is Logger("flaky"))
+    """)
+
+    assert result.stdout.splitlines()[-2:] == ["failed once", "True"]
+    assert "built on retry" in project.read_logs("flaky")
+
+
+def test_different_settings_for_an_existing_logger_warn(project):
+    result = project.run("""
+        import logging
+        from logger.logger import Logger
+
+        first = Logger("app", log_level=logging.DEBUG)
+        second = Logger("app", log_level=logging.WARNING)
+        print(first is second, second.log_level)
+    """)
+
+    assert "WARNING: Logger 'app' already exists with log_level 10. Ignoring log_level 30." in result.stdout
+    assert result.stdout.split()[-2:] == ["True", "10"]
+
+
+def test_message_args_are_only_formatted_when_logged(project):
+    project.run("""
+        import logging
+        from logger.logger import Logger
+
+        class FailsToFormat:
+            def __str__(self):
+                raise AssertionError("formatted a disabled message")
+
+        logger = Logger("lazy", log_level=logging.INFO)
+        logger.debug("skipped %s", FailsToFormat())
+        logger.debug("skipped %s", FailsToFormat(), f=True)
+        logger.info("x=%s y=%d", "a", 2)
+    """)
+
+    assert "x=a y=2" in project.read_logs("lazy")
+
+
+def test_exception_with_asterisks_includes_the_traceback(project):
+    project.run("""
+        from logger.logger import Logger
+
+        logger = Logger("failing")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed on %s", "item", f=True)
+    """)
+
+    log = project.read_logs("failing")
+    assert "*" * len("failed on %s") + "\nfailed on item\n" in log
+    assert "Traceback (most recent call last)" in log and "ValueError: boom" in log
+
+
+@pytest.mark.parametrize("level, expected", [('"info"', 20), ('"WARNING"', 30), ('"nonsense"', 10), (40, 40)])
+def test_default_log_level_can_be_a_level_name(project, level, expected):
+    project.write_config(f"""\
+        SYSTEM:
+          DEFAULT_LOG_LEVEL: {level}
+          FORCE_DEFAULT_LOG_LEVEL_FOR_WHOLE_PROGRAM: False
+    """)
+
+    result = project.run("""
+        from logger.logger import Logger
+
+        print(Logger("app").log_level)
+    """)
+
+    assert result.stdout.split()[-1] == str(expected)
+
+
+def test_get_shares_loggers_with_the_constructor(project):
+    result = project.run("""
+        import logging
+        from logger.logger import Logger
+
+        app = Logger.get("app", log_level=logging.DEBUG)
+        Logger.get("app", log_level=logging.ERROR)
+        prompt = Logger.get("prompt", prompt_name="summarize")
+        print(
+            app is Logger.get("app"), app is Logger("app"),
+            prompt is Logger.get("prompt", prompt_name="summarize"), prompt is Logger.get("prompt", prompt_name="translate"),
+            prompt is Logger("prompt", prompt_name="summarize", batch_id=prompt.batch_id),
+        )
+    """)
+
+    assert result.stdout.split()[-5:] == ["True", "True", "True", "False", "True"]
+    assert "WARNING: Logger 'app' already exists with log_level 10. Ignoring log_level 40." in result.stdout
+
+
+def test_folders_emptied_by_the_size_limit_are_removed(project):
+    old_log = os.path.join(project.root, "debug_logs", "old_run", "app", "old.log")
+    kept_log = os.path.join(project.root, "debug_logs", "kept_run", "app", "kept.log")
+    for path in (old_log, kept_log):
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write("x")
+    os.truncate(old_log, 300 * 1024 * 1024) # Sparse, so it's over the 200 MB limit without using the disk space.
+    os.utime(old_log, (0, 0))
+
+    project.run("""
+        import logger.utils.logger.delete_logs_if_they_get_too_big_on_disk as size_limit
+        size_limit._handle_user_input = lambda: True
+
+        from logger.logger import Logger
+        Logger("app")
+    """)
+
+    assert not os.path.exists(os.path.join(project.root, "debug_logs", "old_run"))
+    assert os.path.exists(kept_log)
+
+
+def test_each_run_gets_one_folder_per_logger(project):
+    project.run("""
+        from logger.logger import Logger
+
+        Logger("app").info("hello")
+    """)
+
+    (log_file,) = project.log_files("app")
+    run_folder, logger_folder, _ = os.path.relpath(log_file, os.path.join(project.root, "debug_logs")).split(os.sep)
+    assert logger_folder == "app"
+
+
+def test_flush_and_list_run_folders_writes_pending_records(project):
+    result = project.run("""
+        from logger.logger import Logger, flush_and_list_run_folders
+
+        logger = Logger("app")
+        logger.info("pending")
+        folders = flush_and_list_run_folders()
+        with open(logger.filepath) as f:
+            print("pending" in f.read(), folders == [logger.logger_folder])
+    """)
+
+    assert result.stdout.split()[-2:] == ["True", "True"]
@@ -0,0 +1,71 @@
+import os
+
+from logger.utils.logger.move_logs_folders_into_this_folder_if_there_are_too_many_of_them import (
+    move_logs_folders_into_this_folder_if_there_are_too_many_of_them as move_logs_folders,
+)
+
+
+def _make_log_folders(root, count: int) -> list[str]:
+    names = []
+    for number in range(count):
+        folder = root / f"run_{number}"
+        folder.mkdir()
+        (folder / "run.log").write_text("x" * number)
+        names.append(folder.name)
+    return names
+
+
+def test_nothing_moves_at_or_under_the_threshold(tmp_path):
+    debug_folder = tmp_path / "debug_logs"
+    debug_folder.mkdir()
+    names = _make_log_folders(debug_folder, 3)
+
+    assert move_logs_folders(str(debug_folder / "overflow_debug_logs"), str(debug_folder), too_many=3) == {}
+    assert sorted(os.listdir(debug_folder)) == names
+
+
+def test_moves_every_folder_but_the_overflow_folder(tmp_path):
+    debug_folder = tmp_path / "debug_logs"
+    debug_folder.mkdir()
+    names = _make_log_folders(debug_folder, 4)
+    overflow_folder = debug_folder / "overflow_debug_logs"
+
+    assert move_logs_folders(str(overflow_folder), str(debug_folder), too_many=2) == {}
+    assert os.listdir(debug_folder) == ["overflow_debug_logs"]
+    assert sorted(os.listdir(overflow_folder)) == names
+
+
+def test_overflow_folder_is_skipped_whatever_it_is_called(tmp_path):
+    debug_folder = tmp_path / "debug_logs"
+    debug_folder.mkdir()
+    names = _make_log_folders(debug_folder, 3)
+    overflow_folder = debug_folder / "old_logs"
+    overflow_folder.mkdir()
+
+    move_logs_folders(str(overflow_folder), str(debug_folder), too_many=2)
+
+    assert os.listdir(debug_folder) == ["old_logs"]
+    assert sorted(os.listdir(overflow_folder)) == names
+
+
+def test_overflow_folder_does_not_count_toward_the_threshold(tmp_path):
+    debug_folder = tmp_path / "debug_logs"
+    debug_folder.mkdir()
+    names = _make_log_folders(debug_folder, 2)
+    overflow_folder = debug_folder / "old_logs"
+    overflow_folder.mkdir()
+
+    move_logs_folders(str(overflow_folder), str(debug_folder), too_many=2)
+
+    assert sorted(os.listdir(debug_folder)) == ["old_logs"] + names
+    assert os.listdir(overflow_folder) == []
+
+
+def test_collect_sizes_reports_moved_folders(tmp_path):
+    debug_folder = tmp_path / "debug_logs"
+    debug_folder.mkdir()
+    _make_log_folders(debug_folder, 3)
+
+    sizes = move_logs_folders(str(debug_folder / "overflow_debug_logs"), str(debug_folder), too_many=2, collect_sizes=True)
+
+    assert sizes == {"run_0": 0, "run_1": 1, "run_2": 2}
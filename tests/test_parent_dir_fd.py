@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from logger.utils.logger.parent_dir_fd import ParentDirFd
+
+
+pytestmark = pytest.mark.skipif(not ParentDirFd.supported, reason="dir_fd isn't supported on this platform")
+
+
+def test_split_reuses_the_descriptor_for_the_same_folder(tmp_path):
+    with ParentDirFd() as parent:
+        first_name, first_fd = parent.split(str(tmp_path / "a.log"))
+        second_name, second_fd = parent.split(str(tmp_path / "b.log"))
+
+    assert (first_name, second_name) == ("a.log", "b.log")
+    assert first_fd is not None and first_fd == second_fd
+
+
+def test_split_reopens_for_a_new_folder_and_closes_on_exit(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.log").write_text("")
+
+    with ParentDirFd() as parent:
+        parent.split(str(tmp_path / "a.log"))
+        name, dir_fd = parent.split(str(tmp_path / "sub" / "a.log"))
+        os.unlink(name, dir_fd=dir_fd)
+
+    assert not (tmp_path / "sub" / "a.log").exists()
+    assert parent._fd is None
+
+
+def test_split_falls_back_to_the_full_path_for_a_missing_folder(tmp_path):
+    path = str(tmp_path / "missing" / "a.log")
+
+    with ParentDirFd() as parent:
+        assert parent.split(path) == (path, None)
@@ -0,0 +1,59 @@
+import logging
+import sys
+
+import pytest
+
+from logger.utils.logger.precompiled_formatter import PrecompiledFormatter
+
+
+# The formats Logger uses, for regular and prompt loggers. Keep in sync with Logger._DEFAULT_FMT and Logger._PROMPT_FMT.
+LOGGER_FORMATS = [
+    '%(asctime)s - %(levelname)s - %(filename)s: %(lineno)d - %(message)s',
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+]
+
+
+def _record(msg: str = "Hello %s", args: tuple = ("world",), exc_info=None, created: float = None) -> logging.LogRecord:
+    record = logging.LogRecord("my_app", logging.WARNING, "/path/to/example.py", 42, msg, args, exc_info)
+    if created is not None:
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+    return record
+
+
+@pytest.mark.parametrize("fmt", LOGGER_FORMATS)
+def test_matches_logging_formatter(fmt):
+    record = _record()
+
+    assert PrecompiledFormatter(fmt).format(record) == logging.Formatter(fmt).format(record)
+
+
+@pytest.mark.parametrize("fmt", LOGGER_FORMATS)
+def test_matches_logging_formatter_with_exception(fmt):
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    record = _record(exc_info=exc_info)
+    expected = logging.Formatter(fmt).format(record)
+    record.exc_text = None # Formatting caches the traceback text on the record, so make the second formatter build its own.
+
+    assert PrecompiledFormatter(fmt).format(record) == expected
+
+
+@pytest.mark.parametrize("fmt", LOGGER_FORMATS)
+def test_cached_date_is_refreshed_every_second(fmt):
+    formatter = PrecompiledFormatter(fmt)
+    reference = logging.Formatter(fmt)
+
+    for created in (1700000000.125, 1700000000.875, 1700000001.5, 1700000061.0):
+        record = _record(created=created)
+        assert formatter.format(record) == reference.format(record)
+
+
+def test_non_string_conversions_and_literal_percent():
+    fmt = '%(levelno)03d %% %(lineno)-5d| %(message)r'
+    record = _record()
+
+    assert PrecompiledFormatter(fmt).format(record) == logging.Formatter(fmt).format(record)
@@ -0,0 +1,88 @@
+import os
+
+from logger.utils.logger.scan_debug_tree import scan_debug_tree
+
+
+def _make_file(path: str, content: str = "") -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def test_nested_empty_folders_are_listed_deepest_first(tmp_path):
+    root = str(tmp_path)
+    deepest = os.path.join(root, "a", "b", "c")
+    os.makedirs(deepest)
+
+    _, empty_folders = scan_debug_tree(root)
+
+    assert empty_folders == [deepest, os.path.join(root, "a", "b"), os.path.join(root, "a")]
+
+
+def test_root_folder_is_never_listed(tmp_path):
+    _, empty_folders = scan_debug_tree(str(tmp_path))
+
+    assert empty_folders == []
+
+
+def test_folder_with_only_empty_logs_counts_as_empty(tmp_path):
+    root = str(tmp_path)
+    empty_log = _make_file(os.path.join(root, "run", "empty.log"))
+    full_log = _make_file(os.path.join(root, "kept", "full.log"), "hello")
+
+    log_files, empty_folders = scan_debug_tree(root)
+
+    assert sorted((path, size) for path, size, _ in log_files) == sorted([(empty_log, 0), (full_log, 5)])
+    assert empty_folders == [os.path.join(root, "run")]
+
+
+def test_non_log_files_keep_their_folder(tmp_path):
+    root = str(tmp_path)
+    _make_file(os.path.join(root, "run", "empty.txt"))
+
+    log_files, empty_folders = scan_debug_tree(root)
+
+    assert log_files == []
+    assert empty_folders == []
+
+
+def test_parent_with_a_kept_child_is_not_empty(tmp_path):
+    root = str(tmp_path)
+    os.makedirs(os.path.join(root, "parent", "empty_child"))
+    _make_file(os.path.join(root, "parent", "kept_child", "full.log"), "hello")
+
+    _, empty_folders = scan_debug_tree(root)
+
+    assert empty_folders == [os.path.join(root, "parent", "empty_child")]
+
+
+def test_skipped_folders_are_not_descended_into_or_counted_as_empty(tmp_path):
+    root = str(tmp_path)
+    _make_file(os.path.join(root, "run", "__pycache__", "inner.log"))
+    os.makedirs(os.path.join(root, ".git"))
+
+    log_files, empty_folders = scan_debug_tree(root)
+
+    assert log_files == []
+    assert empty_folders == [] # "run" holds a skipped folder, so it isn't empty.
+
+
+def test_unreadable_folder_is_kept(tmp_path, monkeypatch, capsys):
+    # Fail scandir on one folder directly, since chmod doesn't stop root from reading it.
+    root = str(tmp_path)
+    unreadable = os.path.join(root, "parent", "unreadable")
+    os.makedirs(unreadable)
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if path == unreadable:
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    _, empty_folders = scan_debug_tree(root)
+
+    assert empty_folders == []
+    assert "WARNING: Error scanning folder" in capsys.readouterr().out
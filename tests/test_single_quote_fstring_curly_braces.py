@@ -0,0 +1,42 @@
+import random
+import re
+
+import pytest
+
+from logger.utils.logger.single_quote_fstring_curly_braces import single_quote_fstring_curly_braces
+
+
+def _original_single_quote_fstring_curly_braces(msg):
+    """
+    The function as it was before it was optimized, which the current one has to match exactly.
+    """
+    if isinstance(msg, str) and msg.startswith('f"'):
+        def replacer(match):
+            full_match = match.group(0)
+            content = match.group(1)
+
+            if match.start() > 0 and msg[match.start()-2:match.start()] in ("\n{", ": {"):
+                return full_match
+
+            return f"{{{content!r}}}"
+
+        pattern = r'\{([^}]+?)\}'
+        return re.sub(pattern, replacer, msg)
+    return msg
+
+
+@pytest.mark.parametrize("msg", [
+    'f"{a} x {b}', 'f"x\n{{a} {b}', 'f"a: {b}', 'f"\n{x}\n{{y}}', 'f"{{{z}}}', 'f"{a}{b}{c}', 'f"x{a}',
+    'f"{\'q\'}', 'f"{"q"}', 'f"{a\\b}', 'f"{a\nb}', 'f"{a\tb}', 'f"\x00{é} {日本}',
+    'f"', 'f"{', 'f"}', 'f"no braces', 'plain {a}', 'x\n{{a}', '', 5, None, b'f"{a}',
+])
+def test_matches_the_original(msg):
+    assert single_quote_fstring_curly_braces(msg) == _original_single_quote_fstring_curly_braces(msg)
+
+
+def test_matches_the_original_on_random_strings():
+    rng = random.Random(0)
+    alphabet = '{}\n: ab\\"\'\té\x00'
+    for _ in range(20000):
+        msg = 'f"' + "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert single_quote_fstring_curly_braces(msg) == _original_single_quote_fstring_curly_braces(msg), repr(msg)
@@ -0,0 +1,143 @@
+import logging
+import os
+import threading
+import time
+import weakref
+
+
+# Seconds between periodic flushes of every open BufferedFileHandler.
+FLUSH_INTERVAL = 0.2
+
+# Open handlers, all flushed by one shared background thread rather than a thread per handler.
+_open_handlers: "weakref.WeakSet[BufferedFileHandler]" = weakref.WeakSet()
+_flush_thread: threading.Thread = None
+_flush_thread_lock = threading.Lock()
+
+def _flush_open_handlers_periodically() -> None:
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        for handler in list(_open_handlers):
+            try:
+                handler.flush()
+            except Exception: # Keep flushing the others. The handler reports its own write errors on emit.
+                continue
+
+def _start_flush_thread_once() -> None:
+    """
+    Start the shared flush thread, the first time a BufferedFileHandler is created.
+    """
+    global _flush_thread
+    with _flush_thread_lock:
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_flush_open_handlers_periodically, name="BufferedFileHandlerFlush", daemon=True)
+            _flush_thread.start()
+
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A FileHandler that writes through a large userspace buffer instead of flushing after every record.
+
+    The stock FileHandler issues a write+flush per record, which dominates the cost of logging in tight loops.
+    This handler lets the file object's buffer coalesce records into large writes. One background thread,
+    shared by every open handler, flushes them all every FLUSH_INTERVAL seconds so the log files never lag far behind.
+    Records at `flush_level` or above are flushed right away, like logging.handlers.MemoryHandler,
+    so errors reach the disk even if the process dies before the next periodic flush.
+    If max_bytes is set, the file is rotated like logging.handlers.RotatingFileHandler once it grows past max_bytes.
+    Unlike RotatingFileHandler, the size is tracked with a running count instead of seeking to the end of
+    the file for every record, which would flush the buffer each time.
+
+    Args:
+        filename (str): Path to the log file.
+        mode (str): Mode to open the file with. Defaults to 'a'.
+        encoding (str): Encoding of the log file. Defaults to None.
+        buffer_size (int): Size of the write buffer in bytes. Defaults to 64 KiB.
+        flush_level (int): Records at this level or above flush the buffer immediately. Defaults to logging.ERROR.
+        max_bytes (int): Rotate the file once it holds about this many bytes (counted in characters). 0 never rotates. Defaults to 0.
+        backup_count (int): Number of rotated files to keep, named 'name.1.log', 'name.2.log', etc. Defaults to 0.
+    """
+
+    def __init__(self,
+                 filename: str,
+                 mode: str = 'a',
+                 encoding: str = None,
+                 buffer_size: int = 65536,
+                 flush_level: int = logging.ERROR,
+                 max_bytes: int = 0,
+                 backup_count: int = 0
+                ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        if max_bytes > 0:
+            mode = 'a' # Same as RotatingFileHandler, so earlier output isn't lost on rollover.
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self._bytes_written = os.path.getsize(self.baseFilename) # The file is already open, so it exists.
+
+        # Periodically flush the buffer so logs show up on disk even if the program hangs.
+        _open_handlers.add(self)
+        _start_flush_thread_once()
+
+    def _open(self):
+        """
+        Open the log file with a `buffer_size` io.BufferedWriter underneath the text stream.
+        """
+        return self._builtin_open(self.baseFilename, self.mode,
+                                  buffering=self.buffer_size,
+                                  encoding=self.encoding, errors=self.errors)
+
+    def _backup_filename(self, number: int) -> str:
+        """
+        Name of the number'th rotated file. The number goes before the extension so backups still end with '.log'.
+        """
+        root, ext = os.path.splitext(self.baseFilename)
+        return f"{root}.{number}{ext}"
+
+    def _rollover(self) -> None:
+        """
+        Close the current file, shift the backups up by one, and start a new file.
+        """
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backup_count > 0:
+            for number in range(self.backup_count - 1, 0, -1):
+                source = self._backup_filename(number)
+                if os.path.exists(source):
+                    os.replace(source, self._backup_filename(number + 1))
+            os.replace(self.baseFilename, self._backup_filename(1))
+        else:
+            os.remove(self.baseFilename)
+        self.stream = self._open()
+        self._bytes_written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write the record to the buffer, only flushing it if the record is at `flush_level` or above.
+        """
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if not self.stream:
+            return
+        try:
+            msg = self.format(record) + self.terminator
+            if self.max_bytes > 0:
+                if self._bytes_written and self._bytes_written + len(msg) > self.max_bytes:
+                    self._rollover()
+                self._bytes_written += len(msg)
+            self.stream.write(msg)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """
+        Stop the periodic flush, then flush and close the file.
+        """
+        _open_handlers.discard(self)
+        super().close()
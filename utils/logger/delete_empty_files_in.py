@@ -1,34 +1,43 @@
 import os
 
-# EXAMPLE OF os.walk
-# os.walk returns a generator, that creates a tuple of values (current_path, directories in current_path, files in current_path).
-#
-# Every time the generator is called it will follow each directory recursively until no further sub-directories are available from the initial directory that walk was called upon.
-#
-# As such,
-#
-# os.walk('C:\dir1\dir2\startdir').next()[0] # returns 'C:\dir1\dir2\startdir'
-# os.walk('C:\dir1\dir2\startdir').next()[1] # returns all the dirs in 'C:\dir1\dir2\startdir'
-# os.walk('C:\dir1\dir2\startdir').next()[2] # returns all the files in 'C:\dir1\dir2\startdir'
+
+from .parent_dir_fd import ParentDirFd
+from .scandir_files_with_ending import scandir_files_with_ending
 
 # Auto-clean the specified directory of empty files.
-def delete_empty_files_in(root_folder, with_ending: str = ".log"):
+def delete_empty_files_in(root_folder, with_ending: str = ".log", files: list[tuple[str, int, float]] = None):
     """
     Delete empty files (i.e. file size == 0) with the specified ending
     from the every folder under the specified directory.
+    If files is given (e.g. the log files from scan_debug_tree), its (file_path, file_size, file_date) tuples
+    are used instead of walking root_folder again.
+    Files are removed relative to their open parent folder, so each unlink only resolves the file name.
     """
     file_ending = with_ending # Syntactic sugar.
     count = 0
-    for root, _, filenames in os.walk(root_folder):
-        for filename in filenames:
-            if filename.endswith(file_ending):
-                file_path = os.path.join(root, filename)
-                try:
-                    if os.path.getsize(file_path) == 0: # 0kb
-                        os.remove(file_path)
+
+    if files is not None:
+        with ParentDirFd() as parent:
+            for file_path, file_size, _ in files:
+                if file_size == 0 and file_path.endswith(file_ending): # 0kb
+                    try:
+                        name, dir_fd = parent.split(file_path)
+                        os.unlink(name, dir_fd=dir_fd)
                         count += 1
-                except Exception as e:
-                    print(f"Error deleting file {file_path}: {e}")
-                    continue
+                    except Exception as e:
+                        print(f"Error deleting file {file_path}: {e}")
+        print(f"Deleted {count} files with '{file_ending}' ending.")
+        return
+
+    with ParentDirFd() as parent:
+        for entry in scandir_files_with_ending(root_folder, file_ending):
+            try:
+                if entry.stat(follow_symlinks=False).st_size == 0: # 0kb
+                    name, dir_fd = parent.split(entry.path)
+                    os.unlink(name, dir_fd=dir_fd)
+                    count += 1
+            except Exception as e:
+                print(f"Error deleting file {entry.path}: {e}")
+                continue
     print(f"Deleted {count} files with '{file_ending}' ending.")
     return
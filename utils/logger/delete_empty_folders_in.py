@@ -1,24 +1,48 @@
+import errno
 import os
 
-def delete_empty_folders_in(directory: str) -> None:
+
+from .parent_dir_fd import ParentDirFd
+from .scandir_files_with_ending import SKIP_FOLDER_NAMES
+
+def _delete_empty_folder(dir_path: str, parent: ParentDirFd) -> None:
+    try:
+        # rmdir refuses to delete a folder that isn't empty, so there's no need to list it first.
+        name, dir_fd = parent.split(dir_path)
+        os.rmdir(name, dir_fd=dir_fd)
+        print(f"Deleted empty folder: '{dir_path}'")
+    except OSError as e:
+        if e.errno in (errno.ENOTEMPTY, errno.EEXIST): # Not empty, so leave it be.
+            return
+        print(f"OSError deleting folder '{dir_path}': {e}")
+    except Exception as e:
+        print(f"Error deleting folder '{dir_path}': {e}")
+
+
+def delete_empty_folders_in(directory: str, empty_folders: list[str] = None) -> None:
     """
     Delete empty folders in the given directory.
     It walks through the directory tree bottom-up to ensure that nested empty folders
     are deleted properly.
+    Folders named in SKIP_FOLDER_NAMES are skipped, along with everything under them.
 
     Args:
         directory (str): The path to the directory to search for empty folders.
+        empty_folders (list[str], optional): Precomputed empty folders, deepest first (e.g. from scan_debug_tree).
+            If given, these are deleted instead of walking the directory again.
     """
-    for root, dirs, _ in os.walk(directory, topdown=False):
-        for dir_name in dirs:
-            dir_path = os.path.join(root, dir_name)
-            try:
-                # Check if the directory is empty
-                if not os.listdir(dir_path):
-                    os.rmdir(dir_path)
-                    print(f"Deleted empty folder: '{dir_path}'")
-            except OSError as e:
-                print(f"OSError deleting folder '{dir_path}': {e}")
-            except Exception as e:
-                print(f"Error deleting folder '{dir_path}': {e}")
+    with ParentDirFd() as parent:
+        if empty_folders is not None:
+            for dir_path in empty_folders:
+                _delete_empty_folder(dir_path, parent)
+            return
+
+        # Walk top-down so skipped folders can be pruned before descending into them,
+        # then delete deepest first so nested empty folders go before their parents.
+        dir_paths = []
+        for root, dirs, _ in os.walk(directory, topdown=True):
+            dirs[:] = [dir_name for dir_name in dirs if dir_name not in SKIP_FOLDER_NAMES]
+            dir_paths.extend(os.path.join(root, dir_name) for dir_name in dirs)
+        for dir_path in reversed(dir_paths):
+            _delete_empty_folder(dir_path, parent)
 
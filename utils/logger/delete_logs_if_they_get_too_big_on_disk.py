@@ -1,14 +1,20 @@
 
+import heapq
 import os
+import select
+import sys
 import time
 
+
+from .scandir_files_with_ending import scandir_files_with_ending
+
 MAX_FILES_TO_DELETE_AT_ONCE = 100
 
 def _delete_files_until_50_percent_of_max_allowed_size(
     file_path_list: list[tuple[str, float, float]],
     total_size_in_bytes: float,
     max_size_in_bytes: float
-    ) -> None:
+    ) -> int:
     """
     Delete the oldest, largest log files until the total folder size is under 50% of the maximum allowed size 
     or until MAX_FILES_TO_DELETE_AT_ONCE logs have been deleted (currently 100).
@@ -17,25 +23,33 @@ def _delete_files_until_50_percent_of_max_allowed_size(
         file_path_list (list[tuple[str, float, float]: List of tuples containing file information (path, size, date).
         total_size (float): Current total size of all log files in bytes.
         max_size_in_bytes (float): Maximum allowed size of the folder in bytes.
+
+    Returns:
+        int: The number of log files deleted.
     """
     # Return if the case file_path_list is empty for some reason.
     if not file_path_list:
         print("No logs found in debug folder.")
-        return
+        return 0
 
-    # Sort the file list by date (oldest first), then by size (largest first)
-    file_path_list.sort(key=lambda x: (x[2], -x[1]))
+    # Order the file list by date (oldest first), then by size (largest first)
+    # The sort key is built into each tuple up front, so comparisons are between plain tuples instead of calling a key function per file.
+    # At most MAX_FILES_TO_DELETE_AT_ONCE files get deleted, so heapify the list and pop from it instead of sorting all of it.
+    file_path_list = [(file_date, -file_size, file_path, file_size) for file_path, file_size, file_date in file_path_list]
+    heapq.heapify(file_path_list)
 
     # Delete files until the total size is under 50% of the max size
     deleted_files = 0
     acceptable_size = max_size_in_bytes / 2
     current_size = total_size_in_bytes
 
-    for file_path, file_size, _ in file_path_list:
+    while file_path_list:
 
         if current_size <= acceptable_size:
             break
 
+        _, _, file_path, file_size = heapq.heappop(file_path_list)
+
         try:
             os.remove(file_path)
             current_size -= file_size
@@ -49,7 +63,28 @@ def _delete_files_until_50_percent_of_max_allowed_size(
             break
 
     print(f"Deleted {deleted_files} logs from debug_logs folder.")
-    return
+    return deleted_files
+
+
+def _sum_log_sizes(debug_folder: str) -> int:
+    """
+    Add up the sizes of all log files in the debug folder, without building the file list.
+    This is all that's needed when the folder is under its size limit, which is almost always.
+
+    Args:
+        debug_folder (str): The path to the debug folder containing log files.
+
+    Returns:
+        int: The total size of all log files in bytes.
+    """
+    total_size_in_bytes = 0
+    for entry in scandir_files_with_ending(debug_folder, '.log'):
+        try:
+            total_size_in_bytes += entry.stat(follow_symlinks=False).st_size
+        except OSError as e:
+            print(f"WARNING: Error accessing file '{entry.path}': {e}")
+            continue
+    return total_size_in_bytes
 
 
 def _get_log_files_info_and_total_size(debug_folder: str) -> tuple[list[tuple[str, float, float]], float]:
@@ -68,41 +103,78 @@ def _get_log_files_info_and_total_size(debug_folder: str) -> tuple[list[tuple[st
     total_size_in_bytes = 0
     file_path_list = []
 
-    for root, _, filenames in os.walk(debug_folder):
-        for filename in filenames:
-            if filename.endswith('.log'):
-                file_path = os.path.join(root, filename)
-                try:
-                    file_size = os.path.getsize(file_path)
-                    file_date = os.path.getmtime(file_path)
+    for entry in scandir_files_with_ending(debug_folder, '.log'):
+        try:
+            stat = entry.stat(follow_symlinks=False)
+            file_size = stat.st_size
+            file_date = stat.st_mtime
 
-                    total_size_in_bytes += file_size
-                    file_info = (file_path, file_size, file_date)
-                    file_path_list.append(file_info)
+            total_size_in_bytes += file_size
+            file_info = (entry.path, file_size, file_date)
+            file_path_list.append(file_info)
 
-                except OSError as e:
-                    print(f"WARNING: Error accessing file '{file_path}': {e}")
-                    continue
+        except OSError as e:
+            print(f"WARNING: Error accessing file '{entry.path}': {e}")
+            continue
 
     return file_path_list, total_size_in_bytes
 
 
+def _read_line_with_timeout(timeout_seconds: float) -> str | None:
+    """
+    Read a line from stdin, or return None if nothing was entered within timeout_seconds.
+    """
+    if os.name == 'nt': # select only works on sockets on Windows, so poll the console instead.
+        import msvcrt
+        deadline = time.monotonic() + timeout_seconds
+        chars = []
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                char = msvcrt.getwche()
+                if char in ('\r', '\n'):
+                    print()
+                    return "".join(chars)
+                chars.append(char)
+            else:
+                time.sleep(0.05)
+        return None
+
+    ready, _, _ = select.select([sys.stdin], [], [], timeout_seconds)
+    if not ready:
+        return None
+    return sys.stdin.readline()
+
+
 def _handle_user_input(timeout_seconds: int = 30) -> bool:
-    """Handle user input with timeout."""
-    start_time = time.time()
+    """
+    Handle user input with timeout.
+    Returns False without asking if stdin isn't a terminal (e.g. CI or a background service), so it never hangs waiting for an answer.
+    """
+    if sys.stdin is None or not sys.stdin.isatty():
+        print("No terminal to ask for confirmation. Returning...")
+        return False
+
+    deadline = time.monotonic() + timeout_seconds
+    print("Would you like to delete some of them? The oldest, largest files will be deleted first (y/n): ", end="", flush=True)
 
     while True:
-        if time.time() - start_time > timeout_seconds:
-            print(f"Timeout: No response received within {timeout_seconds} seconds. Returning...")
+        remaining = deadline - time.monotonic()
+        enter = _read_line_with_timeout(remaining) if remaining > 0 else None
+        if enter is None:
+            print(f"\nTimeout: No response received within {timeout_seconds} seconds. Returning...")
             return False
 
-        enter = input("Would you like to delete some of them? The oldest, largest files will be deleted first (y/n): ")
+        enter = enter.strip()
         if enter.lower() in ['y', 'n']:
-            return True if enter.lower() == 'y' else False
-        print("Please enter 'y' or 'n': ")
+            return enter.lower() == 'y'
+        print("Please enter 'y' or 'n': ", end="", flush=True)
 
 
-def delete_logs_if_they_get_too_big_on_disk(debug_folder: str, max_size_in_megabytes: float | int) -> None:
+def delete_logs_if_they_get_too_big_on_disk(
+    debug_folder: str,
+    max_size_in_megabytes: float | int,
+    log_files: list[tuple[str, float, float]] = None
+    ) -> int:
     """
     Delete old log files if the total size exceeds the specified maximum.
     NOTE: This function has a lot of checks behind it to prevent it from accidentally deleting something important.
@@ -110,22 +182,29 @@ def delete_logs_if_they_get_too_big_on_disk(debug_folder: str, max_size_in_megab
     Args:
         debug_folder: Path to the debug folder containing log files.
         max_size_in_megabytes: Maximum allowed size of the folder in megabytes.
+        log_files: Precomputed (file_path, file_size, file_date) tuples for the log files (e.g. from scan_debug_tree).
+            If given, these are used instead of walking debug_folder again.
 
+    Returns:
+        int: The number of log files deleted. 0 if the folder was under the limit or nothing was deleted.
     """
     # Check if input variables have valid values.
     if debug_folder is None or not debug_folder.strip():
         print("WARNING: debug_folder must be a non-empty string. Returning...")
-        return
+        return 0
 
     if max_size_in_megabytes is None or max_size_in_megabytes <= 0:
         print("WARNING: max_size_in_megabytes must be a positive float or integer. Returning...")
-        return
+        return 0
 
     if not os.path.isdir(debug_folder):
         print(f"WARNING: debug_folder directory '{debug_folder}' does not exist. Returning...")
-        return
+        return 0
 
-    file_path_list, total_size_in_bytes = _get_log_files_info_and_total_size(debug_folder)
+    if log_files is not None:
+        total_size_in_bytes = sum(file_size for _, file_size, _ in log_files)
+    else:
+        total_size_in_bytes = _sum_log_sizes(debug_folder)
 
     # Convert to bytes for easier comparison.
     max_size_in_bytes = float(max_size_in_megabytes * (1024 ** 2))
@@ -133,7 +212,12 @@ def delete_logs_if_they_get_too_big_on_disk(debug_folder: str, max_size_in_megab
     if total_size_in_bytes > max_size_in_bytes:
         print(f"WARNING: Total size of logs in debug folder is more than the maximum size of {max_size_in_megabytes} megabytes.")
         if not _handle_user_input():
-            return
+            return 0
         else:
-            _delete_files_until_50_percent_of_max_allowed_size(file_path_list, total_size_in_bytes, max_size_in_bytes)
-    return
+            # Only build the full file list once we know some files have to go.
+            if log_files is not None:
+                file_path_list = list(log_files)
+            else:
+                file_path_list, total_size_in_bytes = _get_log_files_info_and_total_size(debug_folder)
+            return _delete_files_until_50_percent_of_max_allowed_size(file_path_list, total_size_in_bytes, max_size_in_bytes)
+    return 0
@@ -3,19 +3,27 @@ import sys
 import traceback
 
 
-from .delete_empty_files_in import delete_empty_files_in
-from .delete_empty_folders_in import delete_empty_folders_in
+from logger.logger import Logger, flush_and_list_run_folders
 
-from logger.logger import Logger
-logger = Logger(logger_name="UNCAUGHT_EXCEPTION")
 
-
-# Define general folder for log files
-script_dir = os.path.dirname(os.path.realpath(__file__))
-PROJECT_ROOT = os.path.dirname(os.path.dirname(script_dir))
-PROGRAM_NAME = os.path.basename(PROJECT_ROOT)
-debug_log_folder = os.path.join(PROJECT_ROOT, "debug_logs")
-overflow_debug_folder = os.path.join(debug_log_folder, "overflow_debug_logs")
+def _delete_empty_logs_from_this_run() -> None:
+    """
+    Delete empty log files, and then empty folders, from the folders of this run's loggers only.
+    That's one scandir per logger folder, instead of walking the whole debug folder while the program is crashing.
+    Older runs get the full cleanup the next time the program starts.
+    """
+    # Push anything still queued or buffered to disk first, so a log with pending records doesn't look empty.
+    for folder in flush_and_list_run_folders():
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".log") and entry.is_file(follow_symlinks=False) \
+                        and entry.stat(follow_symlinks=False).st_size == 0: # 0kb
+                        os.unlink(entry.path)
+            os.rmdir(folder) # Fails if anything is left in it, which is what we want.
+            print(f"Deleted empty folder: '{folder}'")
+        except OSError:
+            continue
 
 
 def handle_uncaught_exception(exc_type, exc_value, exc_traceback):
@@ -53,11 +61,13 @@ def handle_uncaught_exception(exc_type, exc_value, exc_traceback):
         exc_value: {str(exc_value)}
         exc_traceback: {exc_traceback}
         """
+        # NOTE The logger is built here rather than at import, so importing this module stays cheap.
+        # Logger instances are cached, so this is just a lookup after the first time.
+        logger = Logger(logger_name="UNCAUGHT_EXCEPTION")
         logger.critical(f"!!! Uncaught Exception !!!\n{write_val}", f=True, t=5)
 
     # Delete empty folders and files to make finding the errors easier.
-    delete_empty_files_in(debug_log_folder, with_ending=".log")
-    delete_empty_folders_in(debug_log_folder)
+    _delete_empty_logs_from_this_run()
     return
 
 
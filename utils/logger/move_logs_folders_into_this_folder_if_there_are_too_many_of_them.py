@@ -1,11 +1,54 @@
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import errno
+from itertools import repeat
+import os
+import shutil
+
+
+# Folders that are never log folders, so they're never moved. Includes the overflow folder's default and legacy names.
+_EXCLUDED_FOLDER_NAMES = frozenset({"overflow_debug_logs", "overflow_debug_folder"})
+
+# Most folders copied at once when the overflow folder is on a different filesystem.
+_MAX_CROSS_FILESYSTEM_MOVES = 8
+
+
+def _folder_size(folder_path: str) -> int:
+    """
+    Total size in bytes of the files under folder_path, walked with os.scandir. Unreadable entries are skipped.
+    """
+    total_size = 0
+    stack = [folder_path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total_size
+
+
+def _move_folder_across_filesystems(folder: os.DirEntry, destination_prefix: str) -> OSError | None:
+    """
+    Copy the folder into destination_prefix and delete the original, for moves that can't be a rename.
+    Returns the error if the move failed.
+    """
+    try:
+        shutil.move(folder.path, destination_prefix + folder.name)
+    except OSError as e:
+        return e
+    return None
 
 
 def move_logs_folders_into_this_folder_if_there_are_too_many_of_them(
         overflow_debug_folder: str,
         debug_log_folder: str,
-        too_many: int = 25
-    ) -> None:
+        too_many: int = 25,
+        collect_sizes: bool = False
+    ) -> dict[str, int]:
     """
     Move log folders from debug_log_folder to overflow_debug_folder if there are too many.
 
@@ -17,24 +60,110 @@ def move_logs_folders_into_this_folder_if_there_are_too_many_of_them(
         overflow_debug_folder (str): The path to the folder where excess log folders will be moved.
         debug_log_folder (str): The path to the folder containing the log folders to be checked.
         too_many (int, optional): The threshold number of folders. Defaults to 25.
+        collect_sizes (bool, optional): Whether to measure the folders that were moved. Walking every moved folder
+            is extra I/O, so it's off unless the caller wants the sizes. Defaults to False.
 
     Returns:
-        None
+        dict[str, int]: If collect_sizes is set, the name of each folder that was moved, mapped to its size in bytes
+            in the overflow folder. Folders that failed to move are left out. Empty otherwise, or if nothing was moved.
 
     Side Effects:
         - Prints a message if folders are being moved.
         - Moves folders from debug_log_folder to overflow_debug_folder if the threshold is exceeded.
     """
-    debug_path = Path(debug_log_folder)
-    overflow_path = Path(overflow_debug_folder)
+    # Identify the overflow folder by its inode, so it's skipped whatever it's called.
+    # The old name check looked for "overflow_debug_folder", which didn't match the actual "overflow_debug_logs" folder.
+    try:
+        overflow_inode = os.stat(overflow_debug_folder).st_ino
+    except OSError:
+        overflow_inode = None # Doesn't exist yet, so there's nothing to skip.
 
     # Count folders, excluding the overflow_debug_folder itself and the _debug_logs_go_here.txt file
-    log_folders = [f for f in debug_path.iterdir() if f.is_dir() and f.name != "overflow_debug_folder"]
-    if len(log_folders) > too_many:
-        print(f"Moving {len(log_folders)} log folders to {overflow_path} because there are too many folders in {debug_path}.")
+    # os.scandir gets each entry's type and inode from the directory listing itself, so neither check needs a stat per entry.
+    with os.scandir(debug_log_folder) as entries:
+        log_folders = [
+            entry for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and entry.name not in _EXCLUDED_FOLDER_NAMES
+            and entry.inode() != overflow_inode
+        ]
+    # Under the threshold is the usual case, so return before doing any of the moving work.
+    if len(log_folders) <= too_many:
+        return {}
+
+    # Make sure the overflow folder exists up front, rather than having every rename fail on its own if it doesn't.
+    try:
+        os.makedirs(overflow_debug_folder, exist_ok=True)
+    except OSError as e:
+        print(f"ERROR creating overflow folder {overflow_debug_folder}: {e}")
+        return {}
+
+    print(f"Moving {len(log_folders)} log folders to {overflow_debug_folder} because there are too many folders in {debug_log_folder}.")
+
+    # Folder names from scandir never contain a separator, so the fallback destination is just a string concat.
+    destination_prefix = os.path.join(overflow_debug_folder, "")
+
+    # Collect failures by errno and report them in one print, rather than one synchronous write to the console per folder.
+    failures: dict[int, list[str]] = {}
+    moved_folder_names: list[str] = []
+
+    # Check once whether both folders are on the same filesystem, instead of finding out from an EXDEV per folder.
+    try:
+        same_filesystem = os.stat(debug_log_folder).st_dev == os.stat(overflow_debug_folder).st_dev
+    except OSError:
+        same_filesystem = True # Let the renames report the problem.
+
+    if not same_filesystem:
+        # Renaming can't cross filesystems, so each folder has to be copied and deleted.
+        # That's mostly waiting on I/O, so move several folders at once.
+        with ThreadPoolExecutor(max_workers=_MAX_CROSS_FILESYSTEM_MOVES) as pool:
+            results = pool.map(_move_folder_across_filesystems, log_folders, repeat(destination_prefix))
+            for folder, error in zip(log_folders, results):
+                if error is not None:
+                    failures.setdefault(error.errno, []).append(folder.name)
+                else:
+                    moved_folder_names.append(folder.name)
+        log_folders = [] # All handled.
+
+    # Rename relative to open handles on both folders, so the kernel doesn't re-resolve the full paths for every move.
+    src_dir_fd = dst_dir_fd = None
+    if log_folders and os.rename in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY'):
+        try:
+            src_dir_fd = os.open(debug_log_folder, os.O_RDONLY | os.O_DIRECTORY)
+            dst_dir_fd = os.open(overflow_debug_folder, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            pass # Fall back to full paths.
+
+    try:
         for folder in log_folders:
             try:
-                destination = overflow_path / folder.name
-                folder.rename(destination)
-            except Exception as e:
-                print(f"ERROR moving folder {folder.name}: {e}")
+                if src_dir_fd is not None and dst_dir_fd is not None:
+                    os.rename(folder.name, folder.name, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+                else:
+                    os.rename(folder.path, destination_prefix + folder.name)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    failures.setdefault(e.errno, []).append(folder.name)
+                    continue
+                # This folder is on another filesystem (e.g. it's a mount point), so copy it over instead.
+                try:
+                    shutil.move(folder.path, destination_prefix + folder.name)
+                except OSError as move_error:
+                    failures.setdefault(move_error.errno, []).append(folder.name)
+                    continue
+            moved_folder_names.append(folder.name)
+    finally:
+        for dir_fd in (src_dir_fd, dst_dir_fd):
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+    if failures:
+        lines = [f"ERROR moving {sum(len(names) for names in failures.values())} log folders to {overflow_debug_folder}:"]
+        for error_number, names in failures.items():
+            reason = f"{errno.errorcode.get(error_number, error_number)} ({os.strerror(error_number)})" if error_number else "Unknown error"
+            lines.append(f"    {reason}: {', '.join(names)}")
+        print("\n".join(lines))
+
+    if not collect_sizes:
+        return {}
+    return {name: _folder_size(destination_prefix + name) for name in moved_folder_names}
@@ -0,0 +1,52 @@
+import os
+
+
+class ParentDirFd:
+    """
+    Keeps the parent folder of the last path open, so os.unlink/os.rmdir can take just the file name plus a dir_fd.
+    The kernel then only resolves one path component per call instead of the whole path,
+    which adds up when deleting many files from the same deep folder.
+    Consecutive paths in the same folder reuse the open descriptor.
+    On platforms without dir_fd support (e.g. Windows), paths are passed through unchanged.
+
+    Example:
+        >>> with ParentDirFd() as parent:
+        ...     for file_path in file_paths:
+        ...         name, dir_fd = parent.split(file_path)
+        ...         os.unlink(name, dir_fd=dir_fd)
+    """
+
+    supported = os.unlink in os.supports_dir_fd and os.rmdir in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
+
+    def __init__(self):
+        self._folder = None
+        self._fd = None
+
+    def split(self, path: str) -> tuple[str, int | None]:
+        """
+        Return (name, dir_fd) for path, or (path, None) if dir_fd isn't supported or the folder can't be opened.
+        """
+        if not self.supported:
+            return path, None
+
+        folder, name = os.path.split(path)
+        if folder != self._folder:
+            self.close()
+            try:
+                self._fd = os.open(folder or '.', os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                return path, None
+            self._folder = folder
+        return name, self._fd
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+        self._folder = None
+        self._fd = None
+
+    def __enter__(self) -> 'ParentDirFd':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,96 @@
+import logging
+from operator import attrgetter
+import re
+import time
+from typing import Callable
+
+
+# Matches a printf-style record field, e.g. '%(asctime)s' or '%(lineno)d'.
+_FIELD_PATTERN = re.compile(r'%\((\w+)\)([#0+ -]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa])')
+
+
+class PrecompiledFormatter(logging.Formatter):
+    """
+    A logging.Formatter that parses its format string once, instead of once per record.
+
+    The format string is split into a list of parts at construction time. Each part is
+    either a constant string or a function that fetches a field from the LogRecord,
+    so formatting a record is a single str.join over the parts.
+    The date part of asctime is also cached, since bursts of records usually share the same second.
+
+    Args:
+        fmt (str): A '%'-style format string, e.g. '%(asctime)s - %(levelname)s - %(message)s'.
+        datefmt (str): A time.strftime format for asctime. Defaults to the stdlib's '%Y-%m-%d %H:%M:%S,mmm'.
+
+    Example:
+        >>> formatter = PrecompiledFormatter('%(levelname)s: %(lineno)d - %(message)s')
+        >>> record = logging.LogRecord("example", logging.INFO, "example.py", 4, "Hello world!", None, None)
+        >>> formatter.format(record)
+        'INFO: 4 - Hello world!'
+    """
+
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        self._parts = self._compile(self._fmt)
+        self._uses_time = self.usesTime()
+        self._last_asctime = (None, "") # (second, formatted date for that second)
+
+    @staticmethod
+    def _compile(fmt: str) -> list[Callable[[logging.LogRecord], str]]:
+        """
+        Split the format string into constant strings and record field fetchers.
+        """
+        parts = []
+        position = 0
+        for match in _FIELD_PATTERN.finditer(fmt):
+            if match.start() > position:
+                constant = fmt[position:match.start()].replace('%%', '%')
+                parts.append(lambda record, constant=constant: constant)
+
+            name, conversion = match.groups()
+            get = attrgetter(name)
+            if conversion == 's':
+                parts.append(lambda record, get=get: str(get(record)))
+            else:
+                spec = f"%{conversion}"
+                parts.append(lambda record, get=get, spec=spec: spec % (get(record),))
+            position = match.end()
+
+        if position < len(fmt):
+            constant = fmt[position:].replace('%%', '%')
+            parts.append(lambda record, constant=constant: constant)
+        return parts
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        """
+        Same output as logging.Formatter.formatTime, but only calls strftime once per second.
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, date = self._last_asctime
+        if second != cached_second:
+            date = time.strftime(self.default_time_format, self.converter(record.created))
+            self._last_asctime = (second, date)
+        return self.default_msec_format % (date, record.msecs)
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        s = "".join([part(record) for part in self._parts])
+
+        # Append exception and stack info, same as logging.Formatter.format
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        return s
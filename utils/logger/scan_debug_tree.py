@@ -0,0 +1,60 @@
+import os
+
+
+from .scandir_files_with_ending import SKIP_FOLDER_NAMES
+
+def scan_debug_tree(root_folder: str) -> tuple[list[tuple[str, int, float]], list[str]]:
+    """
+    Walk the debug folder once with os.scandir, collecting everything the log cleanup functions need.
+    This replaces a separate os.walk per cleanup function, and stats each log file only once.
+    Folders named in SKIP_FOLDER_NAMES aren't descended into, and are never counted as empty.
+
+    Args:
+        root_folder (str): The path to the debug folder.
+
+    Returns:
+        tuple: A tuple containing two elements:
+            - list[tuple[str, int, float]]: A list of tuples, each containing (file_path, file_size, file_date) for each log file.
+            - list[str]: Folders under root_folder that will be empty once empty log files are deleted, deepest first.
+    """
+    log_files = []
+    visited = [] # Folders in the order they were visited. Parents always come before their children.
+    kept_entries = {} # Folder -> number of entries in it that the cleanup won't delete.
+    sub_folders = {} # Folder -> its sub-folders.
+
+    stack = [root_folder]
+    while stack:
+        folder = stack.pop()
+        visited.append(folder)
+        kept_entries[folder] = 0
+        sub_folders[folder] = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in SKIP_FOLDER_NAMES:
+                            kept_entries[folder] += 1
+                            continue
+                        sub_folders[folder].append(entry.path)
+                        stack.append(entry.path)
+                        continue
+
+                    if entry.name.endswith('.log') and entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        log_files.append((entry.path, stat.st_size, stat.st_mtime))
+                        if stat.st_size == 0: # Empty logs get deleted.
+                            continue
+                    kept_entries[folder] += 1
+
+        except OSError as e:
+            print(f"WARNING: Error scanning folder '{folder}': {e}")
+            kept_entries[folder] += 1 # Don't treat a folder we couldn't read as empty.
+
+    # Children are visited after their parents, so walking backwards lets us settle the children first.
+    empty = set()
+    for folder in reversed(visited):
+        if kept_entries[folder] == 0 and all(sub in empty for sub in sub_folders[folder]):
+            empty.add(folder)
+    empty_folders = [folder for folder in reversed(visited) if folder in empty and folder != root_folder]
+
+    return log_files, empty_folders
@@ -0,0 +1,32 @@
+import os
+from typing import Iterator
+
+
+# Folders that never hold logs, so walks don't descend into them.
+SKIP_FOLDER_NAMES = frozenset({'.git', '__pycache__'})
+
+def scandir_files_with_ending(root_folder: str, with_ending: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the files under root_folder whose names end with with_ending, walking the tree with os.scandir.
+    Unlike os.walk + os.path.getsize, each DirEntry caches its stat() result, so callers only pay one stat per file.
+    Folders that can't be read are skipped, same as os.walk, as are folders named in SKIP_FOLDER_NAMES.
+
+    Args:
+        root_folder (str): The path to the folder to walk.
+        with_ending (str): The file ending to look for, e.g. '.log'.
+
+    Yields:
+        os.DirEntry: An entry for each matching file.
+    """
+    stack = [root_folder]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_FOLDER_NAMES:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(with_ending) and entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
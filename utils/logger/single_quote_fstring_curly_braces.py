@@ -1,4 +1,31 @@
 import re
+
+
+# Matches the contents of a pair of curly braces, e.g. '{name}'. Compiled once instead of on every call.
+_CURLY_BRACES_PATTERN = re.compile(r'\{([^}]+?)\}')
+
+
+def _quote_curly_brace_contents(match: re.Match) -> str:
+    """
+    Replacement function for _CURLY_BRACES_PATTERN.sub. Defined once here rather than as a closure on every call.
+    """
+    msg = match.string
+    start = match.start()
+
+    # Check if the curly brace is preceded by "\n" or ":"
+    # Compares the two characters before the match one at a time, instead of slicing them out.
+    # NOTE This used to be a 2-character slice checked against ("\n{", ": {"), so only "\n{" could ever match.
+    # That behaviour is kept as is.
+    if start >= 2 and msg[start-2] == "\n" and msg[start-1] == "{":
+        return match.group(0)
+
+    content = match.group(1)
+
+    # repr() only adds quotes around plain printable text, so skip it when there's nothing it would escape.
+    if "'" not in content and '"' not in content and "\\" not in content and content.isprintable():
+        return "{'" + content + "'}"
+    return f"{{{content!r}}}"
+
 # TODO FIX THIS FUNCTION. IT DOESN'T WORK!!!!
 def single_quote_fstring_curly_braces(msg: str) -> str:
     """
@@ -29,17 +56,7 @@ def single_quote_fstring_curly_braces(msg: str) -> str:
         >>> single_quote_fstring_curly_braces(statement_2)
         "\nShrek is life"
     """
-    if isinstance(msg, str) and msg.startswith('f"'):
-        def replacer(match):
-            full_match = match.group(0)
-            content = match.group(1)
-
-            # Check if the curly brace is preceded by "\n" or ":"
-            if match.start() > 0 and msg[match.start()-2:match.start()] in ("\n{", ": {"):
-                return full_match
-
-            return f"{{{content!r}}}"
-
-        pattern = r'\{([^}]+?)\}'
-        return re.sub(pattern, replacer, msg)
+    # Strings without a curly brace have nothing to quote, so skip the regex entirely.
+    if isinstance(msg, str) and msg[:2] == 'f"' and '{' in msg:
+        return _CURLY_BRACES_PATTERN.sub(_quote_curly_brace_contents, msg)
     return msg
\ No newline at end of file